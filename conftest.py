@@ -1,160 +1,265 @@
 # Root conftest: install Home Assistant mocks BEFORE any test code runs.
 # Must run before tests/conftest.py is loaded (which imports our package).
 import sys
-from unittest.mock import Mock
-
-if "homeassistant" not in sys.modules:
-    mock_ha = Mock()
-    mock_ha.core = Mock()
-    mock_ha.core.HomeAssistant = type("HomeAssistant", (), {})
-    mock_ha.core.callback = lambda x: x
-    mock_ha.config_entries = Mock()
-    mock_ha.config_entries.ConfigEntry = type("ConfigEntry", (), {})
-    mock_ha.config_entries.Platform = Mock()
-    # ConfigFlow base: accepts domain= in subclass and provides flow helpers
-    class _ConfigFlow:
-        def __init__(self):
-            pass
-        @classmethod
-        def __init_subclass__(cls, domain=None, **kwargs):
-            pass
-        def async_show_form(
-            self,
-            step_id,
-            data_schema=None,
-            errors=None,
-            description_placeholders=None,
-            **kwargs,
-        ):
-            return {
-                "type": "form",
-                "step_id": step_id,
-                "errors": errors or {},
-                "description_placeholders": description_placeholders or {},
-            }
-        def async_create_entry(self, title, data):
-            return {"type": "create_entry", "title": title, "data": data}
-        async def async_set_unique_id(self, unique_id):
-            pass
-        def _abort_if_unique_id_configured(self):
-            pass
-    mock_ha.config_entries.ConfigFlow = _ConfigFlow
-
-    mock_ha.const = Mock()
-    mock_ha.const.Platform = Mock()
-    mock_ha.const.EVENT_HOMEASSISTANT_STARTED = "homeassistant_started"
-    mock_ha.components = Mock()
-    mock_ha.components.light = Mock()
-    class _ColorMode:
-        BRIGHTNESS = "brightness"
-        COLOR_TEMP = "color_temp"
-
-    mock_ha.components.light.ColorMode = _ColorMode
-    _LightEntityBase = type("LightEntity", (), {"async_write_ha_state": Mock()})
-    mock_ha.components.light.LightEntity = _LightEntityBase
-    mock_ha.components.light.ATTR_BRIGHTNESS = "brightness"
-    mock_ha.components.light.ATTR_COLOR_TEMP_KELVIN = "color_temp_kelvin"
-    mock_ha.components.light.COLOR_MODE_COLOR_TEMP = "color_temp"
-    mock_ha.components.button = Mock()
-    mock_ha.components.button.ButtonEntity = type("ButtonEntity", (), {})
-    mock_ha.components.mqtt = Mock()
-    mock_ha.components.mqtt.is_connected = Mock(return_value=True)
-    mock_ha.components.mqtt.async_subscribe = Mock()
-    mock_ha.components.mqtt.async_publish = Mock()
-    mock_ha.components.mqtt.ReceiveMessage = Mock()
-    mock_ha.components.group = Mock()
-    mock_ha.components.group.light = Mock()
-
-    class _LightGroup:
-        def __init__(self, unique_id=None, name=None, entity_ids=None, mode=False, **kwargs):
-            self.unique_id = unique_id
-            self.name = name
-            self.entity_ids = entity_ids or []
-            self._attr_is_on = False
-            self._attr_brightness = None
-            self.hass = None
-            self.entity_id = f"light.{(name or 'group').lower().replace(' ', '_')}"
-
-        @property
-        def supported_color_modes(self):
-            return set()
-
-        def async_write_ha_state(self):
-            pass
-
-        def async_update_ha_state(self, force_refresh=False):
-            pass
-
-    mock_ha.components.group.light.LightGroup = _LightGroup
-    mock_ha.exceptions = Mock()
-
-    class _HomeAssistantError(Exception):
+import types
+from unittest.mock import AsyncMock
+
+
+_INSTALLED = False
+# Placeholder for names only used in annotations
+_SENTINEL = object()
+_PLATFORM = types.SimpleNamespace(LIGHT="light", BUTTON="button")
+
+
+def _module(name, **attrs):
+    """Build a concrete stand-in module so imports resolve without Mock.__getattr__."""
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    return mod
+
+
+# ConfigFlow base: accepts domain= in subclass and provides flow helpers
+class _ConfigFlow:
+    def __init__(self):
         pass
+    @classmethod
+    def __init_subclass__(cls, domain=None, **kwargs):
+        pass
+    def async_show_form(
+        self,
+        step_id,
+        data_schema=None,
+        errors=None,
+        description_placeholders=None,
+        **kwargs,
+    ):
+        return {
+            "type": "form",
+            "step_id": step_id,
+            "errors": errors or {},
+            "description_placeholders": description_placeholders or {},
+        }
+    def async_create_entry(self, title, data):
+        return {"type": "create_entry", "title": title, "data": data}
+    async def async_set_unique_id(self, unique_id):
+        pass
+    def _abort_if_unique_id_configured(self):
+        pass
+
+
+class _ColorMode:
+    BRIGHTNESS = "brightness"
+    COLOR_TEMP = "color_temp"
+
+
+class _LightGroup:
+    def __init__(self, unique_id=None, name=None, entity_ids=None, mode=False, **kwargs):
+        self.unique_id = unique_id
+        self.name = name
+        self.entity_ids = entity_ids or []
+        self._attr_is_on = False
+        self._attr_brightness = None
+        self.hass = None
+        self.entity_id = f"light.{(name or 'group').lower().replace(' ', '_')}"
+
+    @property
+    def supported_color_modes(self):
+        return set()
+
+    def async_write_ha_state(self):
+        pass
+
+    def async_update_ha_state(self, force_refresh=False):
+        pass
+
+    def async_update_group_state(self):
+        pass
+
+    async def async_added_to_hass(self):
+        pass
+
+    async def async_will_remove_from_hass(self):
+        pass
+
+
+class _HomeAssistantError(Exception):
+    pass
+
+
+# Base classes must accept constructor args (coordinator, or hass/logger/name/update_interval)
+class _CoordinatorEntity:
+    def __init__(self, coordinator=None, *args, **kwargs):
+        self.coordinator = coordinator
+        self.hass = getattr(coordinator, "hass", None) if coordinator else None
+
+
+class _DataUpdateCoordinator:
+    def __init__(self, hass=None, logger=None, name=None, update_interval=None, *args, **kwargs):
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data = None
+
+    def async_set_updated_data(self, data):
+        self.data = data
+
+    async def async_request_refresh(self):
+        pass
+
+
+# DeviceInfo is used with keyword args (identifiers=, name=, etc.)
+class _DeviceInfo:
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+def _install_ha_mocks():
+    """Register the Home Assistant stand-ins once per process (no-op if HA is installed)."""
+    global _INSTALLED
+    if _INSTALLED:
+        return
+    _INSTALLED = True
+    if "homeassistant" in sys.modules:
+        return
+
+    _ha_core = _module(
+        "homeassistant.core",
+        HomeAssistant=type("HomeAssistant", (), {}),
+        callback=lambda x: x,
+    )
+    _ha_config_entries = _module(
+        "homeassistant.config_entries",
+        ConfigEntry=type("ConfigEntry", (), {}),
+        ConfigFlow=_ConfigFlow,
+        Platform=_PLATFORM,
+    )
+    _ha_const = _module(
+        "homeassistant.const",
+        Platform=_PLATFORM,
+        EVENT_HOMEASSISTANT_STARTED="homeassistant_started",
+    )
+    _ha_light = _module(
+        "homeassistant.components.light",
+        ColorMode=_ColorMode,
+        LightEntity=type(
+            "LightEntity",
+            (),
+            {
+                "async_write_ha_state": lambda self: None,
+                "unique_id": property(lambda self: getattr(self, "_attr_unique_id", None)),
+            },
+        ),
+        ATTR_BRIGHTNESS="brightness",
+        ATTR_COLOR_TEMP_KELVIN="color_temp_kelvin",
+        COLOR_MODE_COLOR_TEMP="color_temp",
+    )
+    _ha_button = _module(
+        "homeassistant.components.button",
+        ButtonEntity=type("ButtonEntity", (), {}),
+    )
+    _ha_mqtt = _module(
+        "homeassistant.components.mqtt",
+        is_connected=lambda hass: True,
+        async_subscribe=AsyncMock(),
+        async_publish=AsyncMock(),
+        ReceiveMessage=type("ReceiveMessage", (), {}),
+    )
+    _ha_group_light = _module(
+        "homeassistant.components.group.light",
+        LightGroup=_LightGroup,
+    )
+    _ha_group = _module("homeassistant.components.group", light=_ha_group_light)
+    _ha_components = _module(
+        "homeassistant.components",
+        light=_ha_light,
+        button=_ha_button,
+        mqtt=_ha_mqtt,
+        group=_ha_group,
+    )
+    _ha_exceptions = _module(
+        "homeassistant.exceptions",
+        HomeAssistantError=_HomeAssistantError,
+    )
+    _ha_auth_const = _module("homeassistant.auth.const", GROUP_ID_USER="system-users")
+    _ha_auth = _module("homeassistant.auth", const=_ha_auth_const)
+    _ha_config_validation = _module(
+        "homeassistant.helpers.config_validation",
+        port=lambda value: value,
+    )
+    _ha_entity_registry = _module(
+        "homeassistant.helpers.entity_registry",
+        EntityRegistry=type("EntityRegistry", (), {}),
+        RegistryEntry=type("RegistryEntry", (), {}),
+        async_get=lambda hass: None,
+        async_entries_for_config_entry=lambda registry, config_entry_id: [],
+    )
+    _ha_device_registry = _module(
+        "homeassistant.helpers.device_registry",
+        async_get=lambda hass: None,
+    )
+    _ha_update_coordinator = _module(
+        "homeassistant.helpers.update_coordinator",
+        DataUpdateCoordinator=_DataUpdateCoordinator,
+        CoordinatorEntity=_CoordinatorEntity,
+    )
+    _ha_entity = _module("homeassistant.helpers.entity", DeviceInfo=_DeviceInfo)
+    _ha_entity_platform = _module(
+        "homeassistant.helpers.entity_platform",
+        AddEntitiesCallback=_SENTINEL,
+    )
+    _ha_helpers = _module(
+        "homeassistant.helpers",
+        config_validation=_ha_config_validation,
+        entity_registry=_ha_entity_registry,
+        device_registry=_ha_device_registry,
+        update_coordinator=_ha_update_coordinator,
+        entity=_ha_entity,
+        entity_platform=_ha_entity_platform,
+    )
+    _ha_data_entry_flow = _module(
+        "homeassistant.data_entry_flow",
+        FlowResult=dict,
+        FlowResultType=types.SimpleNamespace(FORM="form", CREATE_ENTRY="create_entry"),
+    )
+    _ha = _module(
+        "homeassistant",
+        core=_ha_core,
+        config_entries=_ha_config_entries,
+        const=_ha_const,
+        components=_ha_components,
+        exceptions=_ha_exceptions,
+        auth=_ha_auth,
+        helpers=_ha_helpers,
+        data_entry_flow=_ha_data_entry_flow,
+    )
+
+    _HA_MODS = (
+        ("homeassistant", _ha),
+        ("homeassistant.core", _ha_core),
+        ("homeassistant.config_entries", _ha_config_entries),
+        ("homeassistant.const", _ha_const),
+        ("homeassistant.helpers", _ha_helpers),
+        ("homeassistant.helpers.entity_registry", _ha_entity_registry),
+        ("homeassistant.helpers.device_registry", _ha_device_registry),
+        ("homeassistant.components", _ha_components),
+        ("homeassistant.components.light", _ha_light),
+        ("homeassistant.components.button", _ha_button),
+        ("homeassistant.components.mqtt", _ha_mqtt),
+        ("homeassistant.components.group", _ha_group),
+        ("homeassistant.components.group.light", _ha_group_light),
+        ("homeassistant.exceptions", _ha_exceptions),
+        ("homeassistant.auth", _ha_auth),
+        ("homeassistant.auth.const", _ha_auth_const),
+        ("homeassistant.helpers.config_validation", _ha_config_validation),
+        ("homeassistant.helpers.update_coordinator", _ha_update_coordinator),
+        ("homeassistant.helpers.entity", _ha_entity),
+        ("homeassistant.helpers.entity_platform", _ha_entity_platform),
+        ("homeassistant.data_entry_flow", _ha_data_entry_flow),
+    )
+
+    sys.modules.update({name: mod for name, mod in _HA_MODS if name not in sys.modules})
+
 
-    mock_ha.exceptions.HomeAssistantError = _HomeAssistantError
-    mock_ha.auth = Mock()
-    mock_ha.auth.const = Mock()
-    mock_ha.auth.const.GROUP_ID_USER = "system-users"
-    mock_ha.helpers = Mock()
-    mock_ha.helpers.config_validation = Mock()
-    mock_ha.helpers.config_validation.port = lambda value: value
-    mock_ha.helpers.entity_registry = Mock()
-    mock_ha.helpers.entity_registry.EntityRegistry = type("EntityRegistry", (), {})
-    mock_ha.helpers.entity_registry.async_get = Mock()
-    mock_ha.helpers.device_registry = Mock()
-    # Base classes must accept constructor args (coordinator, or hass/logger/name/update_interval)
-    class _CoordinatorEntity:
-        def __init__(self, coordinator=None, *args, **kwargs):
-            self.coordinator = coordinator
-            self.hass = getattr(coordinator, "hass", None) if coordinator else None
-
-    class _DataUpdateCoordinator:
-        def __init__(self, hass=None, logger=None, name=None, update_interval=None, *args, **kwargs):
-            self.hass = hass
-            self.logger = logger
-            self.name = name
-            self.update_interval = update_interval
-            self.data = None
-            self.async_set_updated_data = Mock()
-            self.async_request_refresh = Mock()
-
-    mock_ha.helpers.update_coordinator = Mock()
-    mock_ha.helpers.update_coordinator.DataUpdateCoordinator = _DataUpdateCoordinator
-    mock_ha.helpers.update_coordinator.CoordinatorEntity = _CoordinatorEntity
-    mock_ha.helpers.entity = Mock()
-    # DeviceInfo is used with keyword args (identifiers=, name=, etc.)
-    class _DeviceInfo:
-        def __init__(self, **kwargs):
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-    mock_ha.helpers.entity.DeviceInfo = _DeviceInfo
-    mock_ha.helpers.entity_platform = Mock()
-    mock_ha.helpers.entity_platform.AddEntitiesCallback = Mock()
-    mock_ha.data_entry_flow = Mock()
-    mock_ha.data_entry_flow.FlowResultType = Mock()
-    mock_ha.data_entry_flow.FlowResultType.FORM = "form"
-    mock_ha.data_entry_flow.FlowResultType.CREATE_ENTRY = "create_entry"
-    for name, mod in [
-        ("homeassistant", mock_ha),
-        ("homeassistant.core", mock_ha.core),
-        ("homeassistant.config_entries", mock_ha.config_entries),
-        ("homeassistant.const", mock_ha.const),
-        ("homeassistant.helpers", mock_ha.helpers),
-        ("homeassistant.helpers.entity_registry", mock_ha.helpers.entity_registry),
-        ("homeassistant.helpers.device_registry", mock_ha.helpers.device_registry),
-        ("homeassistant.components", mock_ha.components),
-        ("homeassistant.components.light", mock_ha.components.light),
-        ("homeassistant.components.button", mock_ha.components.button),
-        ("homeassistant.components.mqtt", mock_ha.components.mqtt),
-        ("homeassistant.components.group", mock_ha.components.group),
-        ("homeassistant.components.group.light", mock_ha.components.group.light),
-        ("homeassistant.exceptions", mock_ha.exceptions),
-        ("homeassistant.auth", mock_ha.auth),
-        ("homeassistant.auth.const", mock_ha.auth.const),
-        ("homeassistant.helpers.config_validation", mock_ha.helpers.config_validation),
-        ("homeassistant.helpers.update_coordinator", mock_ha.helpers.update_coordinator),
-        ("homeassistant.helpers.entity", mock_ha.helpers.entity),
-        ("homeassistant.helpers.entity_platform", mock_ha.helpers.entity_platform),
-        ("homeassistant.data_entry_flow", mock_ha.data_entry_flow),
-    ]:
-        sys.modules[name] = mod
+_install_ha_mocks()
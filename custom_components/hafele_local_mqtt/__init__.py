@@ -13,20 +13,32 @@ from .const import (
     CONF_MQTT_PASSWORD,
     CONF_MQTT_PORT,
     CONF_MQTT_USERNAME,
+    CONF_POLLING_INTERVAL,
     CONF_POLLING_MODE,
+    CONF_POLLING_TIMEOUT,
+    CONF_TOPIC_PREFIX,
     CONF_USE_HA_MQTT,
+    DEFAULT_MQTT_PORT,
     DEFAULT_POLLING_INTERVAL,
     DEFAULT_POLLING_MODE,
     DEFAULT_POLLING_TIMEOUT,
+    DEFAULT_TOPIC_PREFIX,
     DOMAIN,
 )
-from .mqtt_client import HafeleMQTTClient
-from .discovery import HafeleDiscovery
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.BUTTON]
 
+# Fallbacks for options missing from older config entries
+_ENTRY_DEFAULTS = {
+    CONF_TOPIC_PREFIX: DEFAULT_TOPIC_PREFIX,
+    CONF_POLLING_INTERVAL: DEFAULT_POLLING_INTERVAL,
+    CONF_POLLING_TIMEOUT: DEFAULT_POLLING_TIMEOUT,
+    CONF_POLLING_MODE: DEFAULT_POLLING_MODE,
+    CONF_MQTT_PORT: DEFAULT_MQTT_PORT,
+}
+
 
 def _entry_uses_ha_mqtt(entry: ConfigEntry) -> bool:
     """Return True when the integration should use Home Assistant's MQTT broker."""
@@ -74,19 +86,23 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hafele Local MQTT from a config entry."""
     _LOGGER.info("Setting up Hafele Local MQTT integration")
+    from .mqtt_client import HafeleMQTTClient
+    from .discovery import HafeleDiscovery
 
     # Get configuration
-    topic_prefix = entry.data.get("topic_prefix", "hafele")
-    polling_interval = entry.data.get("polling_interval", DEFAULT_POLLING_INTERVAL)
-    polling_timeout = entry.data.get("polling_timeout", DEFAULT_POLLING_TIMEOUT)
-    polling_mode = entry.data.get(CONF_POLLING_MODE, DEFAULT_POLLING_MODE)
-    
+    cfg = {**_ENTRY_DEFAULTS, **entry.data}
+    topic_prefix = cfg[CONF_TOPIC_PREFIX]
+
     # Get MQTT broker configuration
     use_ha_mqtt = _entry_uses_ha_mqtt(entry)
-    mqtt_broker = entry.data.get(CONF_MQTT_BROKER) if not use_ha_mqtt else None
-    mqtt_port = entry.data.get(CONF_MQTT_PORT, 1883) if not use_ha_mqtt else 1883
-    mqtt_username = entry.data.get(CONF_MQTT_USERNAME) if not use_ha_mqtt else None
-    mqtt_password = entry.data.get(CONF_MQTT_PASSWORD) if not use_ha_mqtt else None
+    if use_ha_mqtt:
+        mqtt_broker = mqtt_username = mqtt_password = None
+        mqtt_port = DEFAULT_MQTT_PORT
+    else:
+        mqtt_broker = cfg.get(CONF_MQTT_BROKER)
+        mqtt_port = cfg[CONF_MQTT_PORT]
+        mqtt_username = cfg.get(CONF_MQTT_USERNAME)
+        mqtt_password = cfg.get(CONF_MQTT_PASSWORD)
 
     # Initialize MQTT client
     mqtt_client = HafeleMQTTClient(
@@ -104,14 +120,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await discovery.async_start()
 
     # Store in hass data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "mqtt_client": mqtt_client,
         "discovery": discovery,
         "topic_prefix": topic_prefix,
-        "polling_interval": polling_interval,
-        "polling_timeout": polling_timeout,
-        "polling_mode": polling_mode,
+        "polling_interval": cfg[CONF_POLLING_INTERVAL],
+        "polling_timeout": cfg[CONF_POLLING_TIMEOUT],
+        "polling_mode": cfg[CONF_POLLING_MODE],
     }
 
     # Forward setup to platforms
@@ -1,6 +1,7 @@
 """Button platform for Hafele Local MQTT."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -8,13 +9,16 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, EVENT_DEVICES_UPDATED
+from .const import DOMAIN, EVENT_DEVICES_UPDATED, object_id_from_name
 from .debugbutton import HafelePingButton
 from .discovery import HafeleDiscovery
 from .mqtt_client import HafeleMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
+_LIGHT_TYPES = frozenset(("light", "multiwhite", "rgb"))
+_BUTTON_TYPES = frozenset(("lightness", "power"))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -27,18 +31,54 @@ async def async_setup_entry(
     discovery: HafeleDiscovery = data["discovery"]
     topic_prefix = data["topic_prefix"]
 
-    # Track which entities we've already created in this session
-    created_entities: set[tuple[int, str]] = set()  # (device_addr, button_type)
-    
-    # Get entity registry to check for existing entities
-    entity_registry = er.async_get(hass)
+    # Track which button types we've already created per device in this session
+    created_for_addr: dict[int, set[str]] = {}
+
+    @callback
+    def _create_entities_for_devices(
+        device_addrs: Iterable[int] | None = None,
+    ) -> None:
+        """Create button entities for discovered light devices.
 
-    async def _create_entities_for_devices() -> None:
-        """Create button entities for all discovered light devices."""
-        devices = discovery.get_all_devices()
+        Scans every known device when ``device_addrs`` is None, otherwise only
+        the given addresses.
+        """
+        if device_addrs is None:
+            devices = discovery.iter_devices()
+        else:
+            devices = [
+                (addr, device_info)
+                for addr in device_addrs
+                if (device_info := discovery.get_device(addr)) is not None
+            ]
+        # Set-membership first: on steady state every device already has both
+        # buttons and the pass ends here without touching the registry
+        devices = [
+            (addr, device_info)
+            for addr, device_info in devices
+            if not _BUTTON_TYPES <= created_for_addr.get(addr, frozenset())
+        ]
+        if not devices:
+            return
+
+        # Only fetched once there is something to create or register
+        entity_registry = er.async_get(hass)
         new_entities = []
+        # unique_id -> entity_id for this entry's buttons, read once per pass
+        # from HA's per-config-entry index instead of one lookup per button
+        existing_buttons = {
+            registry_entry.unique_id: registry_entry.entity_id
+            for registry_entry in er.async_entries_for_config_entry(
+                entity_registry, entry.entry_id
+            )
+            if registry_entry.domain == "button"
+        }
+        # (unique_id, suggested_object_id) pairs to register once all entities are
+        # built; buttons already in the registry keep their entry untouched
+        registrations: list[tuple[str, str]] = []
 
-        for device_addr, device_info in devices.items():
+        for device_addr, device_info in devices:
+            created_types = created_for_addr.get(device_addr, ())
             device_name = device_info.get("device_name", f"device_{device_addr}")
             
             # Only create buttons for light devices
@@ -48,12 +88,8 @@ async def async_setup_entry(
             # If device_types exists, check if it contains any light-related type
             if device_types:
                 # Check if this is a light type device (case-insensitive check)
-                device_types_lower = [dt.lower() for dt in device_types if isinstance(dt, str)]
-                is_light_device = any(
-                    dtype in ["light", "multiwhite", "rgb"] 
-                    for dtype in device_types_lower
-                )
-                if not is_light_device:
+                device_types_lower = {dt.lower() for dt in device_types if isinstance(dt, str)}
+                if device_types_lower.isdisjoint(_LIGHT_TYPES):
                     _LOGGER.debug(
                         "Skipping button creation for device %s (addr: %s) - not a light type (types: %s)",
                         device_name,
@@ -62,13 +98,12 @@ async def async_setup_entry(
                     )
                     continue
             
+            object_id_base = object_id_from_name(device_name)
+
             # Create "Ping lightness" button
-            lightness_button_id = (device_addr, "lightness")
-            if lightness_button_id not in created_entities:
+            if "lightness" not in created_types:
                 unique_id = f"{device_addr}_ping_lightness"
-                existing_entity_id = entity_registry.async_get_entity_id(
-                    "button", DOMAIN, unique_id
-                )
+                existing_entity_id = existing_buttons.get(unique_id)
                 if existing_entity_id:
                     _LOGGER.debug(
                         "Button entity already exists for device %s lightness (entity_id: %s), restoring",
@@ -87,15 +122,14 @@ async def async_setup_entry(
                     unique_id,
                 )
                 new_entities.append(entity)
-                created_entities.add(lightness_button_id)
+                if not existing_entity_id:
+                    registrations.append((unique_id, f"{object_id_base}_lightness_ping"))
+                created_for_addr.setdefault(device_addr, set()).add("lightness")
             
             # Create "Ping power" button
-            power_button_id = (device_addr, "power")
-            if power_button_id not in created_entities:
+            if "power" not in created_types:
                 unique_id = f"{device_addr}_ping_power"
-                existing_entity_id = entity_registry.async_get_entity_id(
-                    "button", DOMAIN, unique_id
-                )
+                existing_entity_id = existing_buttons.get(unique_id)
                 if existing_entity_id:
                     _LOGGER.debug(
                         "Button entity already exists for device %s power (entity_id: %s), restoring",
@@ -114,25 +148,18 @@ async def async_setup_entry(
                     unique_id,
                 )
                 new_entities.append(entity)
-                created_entities.add(power_button_id)
+                if not existing_entity_id:
+                    registrations.append((unique_id, f"{object_id_base}_power_ping"))
+                created_for_addr.setdefault(device_addr, set()).add("power")
 
         if new_entities:
             _LOGGER.info("Adding %d button entities", len(new_entities))
-            # Register entities in registry with suggested entity_id before adding
-            import re
-            for entity in new_entities:
-                device_name = entity.device_info.get("device_name", f"device_{entity.device_addr}")
-                # Generate entity_id from device name: lowercase, replace spaces with underscores
-                entity_id_base = device_name.lower().replace(" ", "_").replace("-", "_")
-                # Remove any special characters that aren't allowed in entity IDs
-                entity_id_base = re.sub(r"[^a-z0-9_]", "", entity_id_base)
-                suggested_object_id = f"{entity_id_base}_{entity.button_type}_ping"
-                
-                # Register/update entity in registry with suggested entity_id
+            # Register new entities with a suggested entity_id before adding
+            for unique_id, suggested_object_id in registrations:
                 entity_registry.async_get_or_create(
                     "button",
                     DOMAIN,
-                    entity.unique_id,
+                    unique_id,
                     suggested_object_id=suggested_object_id,
                 )
             
@@ -142,7 +169,11 @@ async def async_setup_entry(
     @callback
     def _on_devices_updated(event) -> None:
         """Handle device discovery update event."""
-        hass.async_create_task(_create_entities_for_devices())
+        # Only light discovery carries new addresses; nothing to do otherwise
+        new_addrs = event.data.get("new_addrs")
+        if new_addrs:
+            # Entity creation never awaits, so run it inline with the event
+            _create_entities_for_devices(new_addrs)
 
     # Listen for device discovery updates
     entry.async_on_unload(
@@ -150,5 +181,5 @@ async def async_setup_entry(
     )
 
     # Create entities for any devices already discovered
-    await _create_entities_for_devices()
+    _create_entities_for_devices()
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import cache
 import logging
 import secrets
 import socket
@@ -55,6 +56,35 @@ def generate_password(length: int = 12) -> str:
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
 
+@cache
+def _manual_data_schema() -> vol.Schema:
+    """Build the manual broker form schema on first use and reuse it afterwards.
+
+    Returns:
+        The voluptuous schema for the manual configuration step.
+    """
+    return vol.Schema(
+        {
+            vol.Required(CONF_MQTT_BROKER, default="localhost"): str,
+            vol.Required(CONF_MQTT_PORT, default=1883): cv.port,
+            vol.Optional(CONF_MQTT_USERNAME): str,
+            vol.Optional(CONF_MQTT_PASSWORD): str,
+            vol.Required(CONF_TOPIC_PREFIX, default=DEFAULT_TOPIC_PREFIX): str,
+            vol.Optional(
+                CONF_POLLING_INTERVAL, default=DEFAULT_POLLING_INTERVAL
+            ): vol.All(vol.Coerce(int), vol.Range(min=2)),
+            vol.Optional(
+                CONF_POLLING_TIMEOUT, default=DEFAULT_POLLING_TIMEOUT
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
+            vol.Optional(CONF_POLLING_MODE, default=POLLING_MODE_NORMAL): vol.In(
+                [POLLING_MODE_NORMAL, POLLING_MODE_ROTATIONAL]
+            ),
+            vol.Optional(CONF_ENABLE_GROUPS, default=True): bool,
+            vol.Optional(CONF_ENABLE_SCENES, default=True): bool,
+        }
+    )
+
+
 async def validate_manual_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate manual MQTT broker configuration by performing a test connection.
 
@@ -304,26 +334,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_MQTT_BROKER, default="localhost"): str,
-                    vol.Required(CONF_MQTT_PORT, default=1883): cv.port,
-                    vol.Optional(CONF_MQTT_USERNAME): str,
-                    vol.Optional(CONF_MQTT_PASSWORD): str,
-                    vol.Required(CONF_TOPIC_PREFIX, default=DEFAULT_TOPIC_PREFIX): str,
-                    vol.Optional(
-                        CONF_POLLING_INTERVAL, default=DEFAULT_POLLING_INTERVAL
-                    ): vol.All(vol.Coerce(int), vol.Range(min=2)),
-                    vol.Optional(
-                        CONF_POLLING_TIMEOUT, default=DEFAULT_POLLING_TIMEOUT
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=30)),
-                    vol.Optional(CONF_POLLING_MODE, default=POLLING_MODE_NORMAL): vol.In(
-                        [POLLING_MODE_NORMAL, POLLING_MODE_ROTATIONAL]
-                    ),
-                    vol.Optional(CONF_ENABLE_GROUPS, default=True): bool,
-                    vol.Optional(CONF_ENABLE_SCENES, default=True): bool,
-                }
-            ),
+            data_schema=_manual_data_schema(),
             errors=errors,
         )
 
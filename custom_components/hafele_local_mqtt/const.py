@@ -1,5 +1,54 @@
 """Constants for the Hafele Local MQTT integration."""
 
+from functools import lru_cache
+
+__all__ = (
+    "DOMAIN",
+    "DEFAULT_TOPIC_PREFIX",
+    "TOPIC_LIGHTS",
+    "TOPIC_GROUPS",
+    "TOPIC_SCENES",
+    "DEFAULT_POLLING_INTERVAL",
+    "DEFAULT_POLLING_TIMEOUT",
+    "TOPIC_DISCOVERY_LIGHTS",
+    "TOPIC_DISCOVERY_GROUPS",
+    "TOPIC_DISCOVERY_SCENES",
+    "TOPIC_SET_DEVICE_POWER",
+    "TOPIC_GET_DEVICE_POWER",
+    "TOPIC_SET_DEVICE_LIGHTNESS",
+    "TOPIC_GET_DEVICE_LIGHTNESS",
+    "TOPIC_SET_DEVICE_TEMPERATURE",
+    "TOPIC_SET_DEVICE_CTL",
+    "TOPIC_GET_DEVICE_CTL",
+    "TOPIC_SET_GROUP_POWER",
+    "TOPIC_GET_GROUP_POWER",
+    "TOPIC_SET_GROUP_LIGHTNESS",
+    "TOPIC_GET_GROUP_LIGHTNESS",
+    "TOPIC_SCENE_ACTIVATE",
+    "TOPIC_SET_GROUP_CTL",
+    "TOPIC_SET_GROUP_TEMPERATURE",
+    "TOPIC_DEVICE_STATUS",
+    "TOPIC_GROUP_STATUS",
+    "CONF_TOPIC_PREFIX",
+    "CONF_POLLING_INTERVAL",
+    "CONF_POLLING_TIMEOUT",
+    "CONF_POLLING_MODE",
+    "CONF_ENABLE_GROUPS",
+    "CONF_ENABLE_SCENES",
+    "POLLING_MODE_NORMAL",
+    "POLLING_MODE_ROTATIONAL",
+    "DEFAULT_POLLING_MODE",
+    "CONF_MQTT_BROKER",
+    "CONF_MQTT_PORT",
+    "CONF_MQTT_USERNAME",
+    "CONF_MQTT_PASSWORD",
+    "CONF_USE_HA_MQTT",
+    "DEFAULT_MQTT_PORT",
+    "EVENT_DEVICES_UPDATED",
+    "OBJECT_ID_TABLE",
+    "object_id_from_name",
+)
+
 DOMAIN = "hafele_local_mqtt"
 
 # MQTT Topic Prefix
@@ -19,9 +68,9 @@ DEFAULT_POLLING_TIMEOUT = 3  # seconds
 
 # Discovery topics (RECEIVE - Subscribe)
 # API: RECEIVE lightsDiscovery, groupDiscovery, sceneDiscovery
-TOPIC_DISCOVERY_LIGHTS = f"{{prefix}}/{TOPIC_LIGHTS}"  # {gateway_topic}/lights
-TOPIC_DISCOVERY_GROUPS = f"{{prefix}}/{TOPIC_GROUPS}"  # {gateway_topic}/groups
-TOPIC_DISCOVERY_SCENES = f"{{prefix}}/{TOPIC_SCENES}"  # {gateway_topic}/scenes
+TOPIC_DISCOVERY_LIGHTS = "{prefix}/lights"  # {gateway_topic}/lights
+TOPIC_DISCOVERY_GROUPS = "{prefix}/groups"  # {gateway_topic}/groups
+TOPIC_DISCOVERY_SCENES = "{prefix}/scenes"  # {gateway_topic}/scenes
 
 # Control topics (SEND - Publish)
 # Note: Operation IDs (like setDevicePower, getDevicePower) are for API lookup only, not used in topics
@@ -41,6 +90,7 @@ TOPIC_SET_GROUP_LIGHTNESS = "{prefix}/groups/{group_name}/lightness"  # Operatio
 TOPIC_GET_GROUP_LIGHTNESS = "{prefix}/groups/{group_name}/lightnessGet"  # Operation ID: getGroupLightness
 TOPIC_SCENE_ACTIVATE = "{prefix}/scenes/{scene_name}/activate"  # Operation ID: recallScene
 TOPIC_SET_GROUP_CTL = "{prefix}/groups/{group_name}/ctl" # Group Control
+TOPIC_SET_GROUP_TEMPERATURE = "{prefix}/groups/{group_name}/temperature"  # Operation ID: setGroupTemperature
 
 # Status topics (RECEIVE - Subscribe)
 # API: RECEIVE lightStatus, groupStatus
@@ -74,3 +124,29 @@ DEFAULT_MQTT_PORT = 1883
 # Event names
 EVENT_DEVICES_UPDATED = "hafele_local_mqtt_devices_updated"
 
+
+class _ObjectIdTable(dict):
+    """str.translate table that deletes every character it does not map."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Sanitizes a mesh name into an entity object id in one str.translate pass:
+# ASCII letters are lowercased, spaces and hyphens become underscores, and
+# anything else outside [a-z0-9_] is dropped
+OBJECT_ID_TABLE = _ObjectIdTable(
+    {ord(c): ord(c) for c in "abcdefghijklmnopqrstuvwxyz0123456789_"}
+)
+OBJECT_ID_TABLE.update({ord(c): ord(c.lower()) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+OBJECT_ID_TABLE.update({ord(" "): ord("_"), ord("-"): ord("_")})
+
+
+@lru_cache(maxsize=1024)
+def object_id_from_name(name: str) -> str:
+    """Build a Home Assistant object id fragment from a mesh device or group name.
+
+    Cached: a light's name is sanitized again for every group it belongs to,
+    and the button platform sanitizes the same names once more.
+    """
+    return name.translate(OBJECT_ID_TABLE).strip("_")
@@ -13,10 +13,12 @@ from .const import (
     TOPIC_GET_DEVICE_LIGHTNESS,
     TOPIC_GET_DEVICE_POWER,
 )
-from .mqtt_client import HafeleMQTTClient
+from .mqtt_client import EMPTY_PAYLOAD, HafeleMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
+_MULTIWHITE_TYPES = frozenset(("multiwhite", "rgb"))
+
 
 class HafelePingButton(ButtonEntity):
     """Representation of a Hafele ping button."""
@@ -57,37 +59,39 @@ class HafelePingButton(ButtonEntity):
             model="Local MQTT Light",
         )
 
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        if self.button_type == "lightness":
+        # Topic never changes for this button, so build it once
+        self._ping_topic: str | None = None
+        if button_type == "lightness":
             # Check if device is multiwhite/RGB by checking device_info
-            device_types = self.device_info.get("device_types", [])
-            is_multiwhite = any(
-                isinstance(dt, str) and dt.lower() in ("multiwhite", "rgb")
-                for dt in device_types
+            device_types = device_info.get("device_types", [])
+            is_multiwhite = not _MULTIWHITE_TYPES.isdisjoint(
+                dt.lower() for dt in device_types if isinstance(dt, str)
+            )
+            # Multiwhite/RGB devices use CTL topic, monochrome devices use lightness topic
+            topic_template = (
+                TOPIC_GET_DEVICE_CTL if is_multiwhite else TOPIC_GET_DEVICE_LIGHTNESS
+            )
+            self._ping_topic = topic_template.format(
+                prefix=topic_prefix, device_name=device_name
             )
-            
-            if is_multiwhite:
-                # Multiwhite/RGB devices use CTL topic
-                topic = TOPIC_GET_DEVICE_CTL.format(
-                    prefix=self.topic_prefix, device_name=self.device_name
-                )
-                _LOGGER.debug("Ping lightness button pressed for Multiwhite or RGB device %s", self.device_addr)
-            else:
-                # Monochrome devices use lightness topic
-                topic = TOPIC_GET_DEVICE_LIGHTNESS.format(
-                    prefix=self.topic_prefix, device_name=self.device_name
-                )
-                _LOGGER.debug("Ping lightness button pressed for Monochrome device %s", self.device_addr)
-        elif self.button_type == "power":
-            topic = TOPIC_GET_DEVICE_POWER.format(
-                prefix=self.topic_prefix, device_name=self.device_name
+        elif button_type == "power":
+            self._ping_topic = TOPIC_GET_DEVICE_POWER.format(
+                prefix=topic_prefix, device_name=device_name
             )
-            _LOGGER.debug("Ping power button pressed for device %s", self.device_addr)
-        else:
+
+    async def async_press(self) -> None:
+        """Handle the button press."""
+        if self._ping_topic is None:
             _LOGGER.error("Unknown button type: %s", self.button_type)
             return
 
+        # The topic shows which GET (ctl vs lightness) this device type uses
+        _LOGGER.debug(
+            "Ping %s button pressed for device %s on %s",
+            self.button_type,
+            self.device_addr,
+            self._ping_topic,
+        )
         # Publish empty payload to request status
-        await self.mqtt_client.async_publish(topic, {}, qos=1)
+        await self.mqtt_client.async_publish(self._ping_topic, EMPTY_PAYLOAD, qos=1)
         _LOGGER.info("Sent %s get request for device %s", self.button_type, self.device_addr)
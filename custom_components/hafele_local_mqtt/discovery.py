@@ -1,13 +1,15 @@
 """Device discovery for Hafele Local MQTT."""
 from __future__ import annotations
 
-import inspect
-import json
+import asyncio
 import logging
-from typing import Any, Callable
+import sys
+from collections.abc import Hashable, ItemsView, Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, TypedDict
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
 
 from .const import (
     EVENT_DEVICES_UPDATED,
@@ -15,14 +17,97 @@ from .const import (
     TOPIC_DISCOVERY_LIGHTS,
     TOPIC_DISCOVERY_SCENES,
 )
-from .mqtt_client import HafeleMQTTClient
+from .mqtt_client import HafeleMQTTClient, async_call_unsubscribers, json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Gateways republish discovery lists in bursts; fire one update per burst
+_FIRE_DEBOUNCE = 0.3  # seconds
+
+
+class LightRecord(TypedDict, total=False):
+    """A light as published on ``{prefix}/lights``."""
+
+    device_addr: int
+    device_name: str
+    location: str
+    device_types: list[str]
+
+
+class GroupRecord(TypedDict, total=False):
+    """A group as published on ``{prefix}/groups``."""
+
+    group_main_addr: int
+    group_name: str
+    devices: list[int]
+
+
+class SceneRecord(TypedDict, total=False):
+    """A scene as published on ``{prefix}/scenes``."""
+
+    scene_id: int
+    scene_name: str
+    scene: str
+    groups: list[int]
+
+
+# Discovery kind -> (storage attribute, id key, name key, fires devices-updated)
+_DISCOVERY_KINDS: dict[str, tuple[str, str, str, bool]] = {
+    "lights": ("devices", "device_addr", "device_name", True),
+    "groups": ("groups", "group_main_addr", "group_name", True),
+    "scenes": ("scenes", "scene_id", "scene_name", False),
+}
+
+# String fields that repeat across every discovery refresh; interning them lets
+# each republished record share one object per value
+_INTERN_KEYS = frozenset(
+    {"device_name", "group_name", "scene_name", "scene", "location", "type", "model"}
+)
+
+
+def _intern_fields(record: dict[str, Any]) -> dict[str, Any]:
+    """Intern the recurring string values of a discovery record in place."""
+    for key in _INTERN_KEYS & record.keys():
+        value = record[key]
+        if isinstance(value, str):
+            record[key] = sys.intern(value)
+    return record
+
+
+def _decode_list(payload: Any) -> list[Any] | None:
+    """Return a discovery payload as a list, decoding raw JSON text or bytes.
+
+    The MQTT client normally hands over already-decoded data; raw payloads
+    only arrive when decoding was skipped upstream. Returns None for
+    anything that is not a JSON array.
+    """
+    if isinstance(payload, (bytes, bytearray, str)):
+        payload = json_loads(payload)
+    return payload if isinstance(payload, list) else None
+
 
 class HafeleDiscovery:
     """Handle device discovery from MQTT topics."""
 
+    __slots__ = (
+        "hass",
+        "mqtt_client",
+        "topic_prefix",
+        "devices",
+        "groups",
+        "scenes",
+        "_devices_view",
+        "_groups_view",
+        "_scenes_view",
+        "_unsubscribers",
+        "_lights_topic",
+        "_groups_topic",
+        "_scenes_topic",
+        "_fire_handle",
+        "_pending_new_addrs",
+        "_pending_new_group_addrs",
+    )
+
     def __init__(
         self, hass: HomeAssistant, mqtt_client: HafeleMQTTClient, topic_prefix: str
     ) -> None:
@@ -30,153 +115,154 @@ class HafeleDiscovery:
         self.hass = hass
         self.mqtt_client = mqtt_client
         self.topic_prefix = topic_prefix
-        self.devices: dict[int, dict[str, Any]] = {}
-        self.groups: dict[int, dict[str, Any]] = {}
-        self.scenes: dict[int, dict[str, Any]] = {}
+        self.devices: dict[int, LightRecord] = {}
+        self.groups: dict[int, GroupRecord] = {}
+        self.scenes: dict[int, SceneRecord] = {}
+        # Read-only live views handed out by get_all_*; no per-call copy
+        self._devices_view = MappingProxyType(self.devices)
+        self._groups_view = MappingProxyType(self.groups)
+        self._scenes_view = MappingProxyType(self.scenes)
         self._unsubscribers: list[Callable[[], None]] = []
+        # Formatted once here; topic strings never change for a given prefix
+        self._lights_topic = sys.intern(TOPIC_DISCOVERY_LIGHTS.format(prefix=topic_prefix))
+        self._groups_topic = sys.intern(TOPIC_DISCOVERY_GROUPS.format(prefix=topic_prefix))
+        self._scenes_topic = sys.intern(TOPIC_DISCOVERY_SCENES.format(prefix=topic_prefix))
+        self._fire_handle: asyncio.TimerHandle | None = None
+        self._pending_new_addrs: list[int] = []
+        self._pending_new_group_addrs: list[int] = []
 
     async def async_start(self) -> None:
         """Start discovery by subscribing to MQTT topics."""
         _LOGGER.info("Starting Hafele device discovery")
 
         # Subscribe to discovery topics
-        lights_topic = TOPIC_DISCOVERY_LIGHTS.format(prefix=self.topic_prefix)
-        groups_topic = TOPIC_DISCOVERY_GROUPS.format(prefix=self.topic_prefix)
-        scenes_topic = TOPIC_DISCOVERY_SCENES.format(prefix=self.topic_prefix)
-
-        unsub_lights = await self.mqtt_client.async_subscribe(
-            lights_topic, self._on_lights_message
+        self._unsubscribers.extend(
+            await self.mqtt_client.async_subscribe_many(
+                [
+                    (self._lights_topic, partial(self._on_discovery, "lights")),
+                    (self._groups_topic, partial(self._on_discovery, "groups")),
+                    (self._scenes_topic, partial(self._on_discovery, "scenes")),
+                ]
+            )
         )
-        unsub_groups = await self.mqtt_client.async_subscribe(
-            groups_topic, self._on_groups_message
-        )
-        unsub_scenes = await self.mqtt_client.async_subscribe(
-            scenes_topic, self._on_scenes_message
-        )
-
-        self._unsubscribers.extend([unsub_lights, unsub_groups, unsub_scenes])
 
     async def async_stop(self) -> None:
         """Stop discovery."""
-        for unsub in self._unsubscribers:
-            if callable(unsub):
-                # Handle both sync and async unsubscribe functions
-                if inspect.iscoroutinefunction(unsub):
-                    await unsub()
-                else:
-                    unsub()
+        await async_call_unsubscribers(self._unsubscribers)
         self._unsubscribers.clear()
+        if self._fire_handle is not None:
+            self._fire_handle.cancel()
+            self._fire_handle = None
         _LOGGER.info("Stopped Hafele device discovery")
 
-    def _on_lights_message(self, topic: str, payload: Any) -> None:
-        """Handle lights discovery message."""
-        try:
-            if isinstance(payload, str):
-                lights = json.loads(payload)
-            else:
-                lights = payload
-
-            if not isinstance(lights, list):
-                _LOGGER.warning("Invalid lights payload format: %s", type(lights))
-                return
-
-            _LOGGER.info("Discovered %d lights", len(lights))
-
-            for light in lights:
-                device_addr = light.get("device_addr")
-                if device_addr is not None:
-                    self.devices[device_addr] = light
-                    _LOGGER.debug(
-                        "Discovered light: %s (addr: %s)",
-                        light.get("device_name"),
-                        device_addr,
-                    )
-
-            # Notify that devices have been updated
-            # Platforms will check discovery on their next update
-            self.hass.bus.async_fire(EVENT_DEVICES_UPDATED)
-
-        except (json.JSONDecodeError, KeyError, TypeError) as err:
-            _LOGGER.error("Error parsing lights message: %s", err)
-
-    def _on_groups_message(self, topic: str, payload: Any) -> None:
-        """Handle groups discovery message."""
-        try:
-            if isinstance(payload, str):
-                groups = json.loads(payload)
-            else:
-                groups = payload
-
-            if not isinstance(groups, list):
-                _LOGGER.warning("Invalid groups payload format: %s", type(groups))
-                return
-
-            _LOGGER.info("Discovered %d groups", len(groups))
-
-            for group in groups:
-                group_addr = group.get("group_main_addr")
-                if group_addr is not None:
-                    self.groups[group_addr] = group
-                    _LOGGER.debug(
-                        "Discovered group: %s (addr: %s)",
-                        group.get("group_name"),
-                        group_addr,
-                    )
-
-            # Notify that groups have been updated
-            self.hass.bus.async_fire(EVENT_DEVICES_UPDATED)
-
-        except (json.JSONDecodeError, KeyError, TypeError) as err:
-            _LOGGER.error("Error parsing groups message: %s", err)
+    def _schedule_fire(
+        self,
+        new_addrs: list[int] | None = None,
+        new_group_addrs: list[int] | None = None,
+    ) -> None:
+        """Schedule a debounced EVENT_DEVICES_UPDATED, accumulating new addresses."""
+        if new_addrs:
+            self._pending_new_addrs.extend(new_addrs)
+        if new_group_addrs:
+            self._pending_new_group_addrs.extend(new_group_addrs)
+        if self._fire_handle is None:
+            self._fire_handle = self.hass.loop.call_later(
+                _FIRE_DEBOUNCE, self._do_fire
+            )
+
+    def _do_fire(self) -> None:
+        """Fire the coalesced devices-updated event."""
+        self._fire_handle = None
+        new_addrs, self._pending_new_addrs = self._pending_new_addrs, []
+        new_group_addrs, self._pending_new_group_addrs = self._pending_new_group_addrs, []
+        self.hass.bus.async_fire(
+            EVENT_DEVICES_UPDATED,
+            {"new_addrs": new_addrs, "new_group_addrs": new_group_addrs},
+        )
 
-    def _on_scenes_message(self, topic: str, payload: Any) -> None:
-        """Handle scenes discovery message."""
+    def _on_discovery(self, kind: str, topic: str, payload: Any) -> None:
+        """Handle a lights, groups or scenes discovery message."""
+        store_attr, id_key, name_key, fires_event = _DISCOVERY_KINDS[kind]
         try:
-            if isinstance(payload, str):
-                scenes = json.loads(payload)
+            records = _decode_list(payload)
+        except ValueError as err:
+            _LOGGER.error("Error parsing %s message: %s", kind, err)
+            return
+        if records is None:
+            _LOGGER.warning("Invalid %s payload format: %s", kind, type(payload))
+            return
+
+        _LOGGER.info("Discovered %d %s", len(records), kind)
+
+        store = getattr(self, store_attr)
+        new_ids: list[int] = []
+        dirty = False
+        for record in records:
+            # Skip malformed entries (not an object, missing or unhashable id)
+            # without losing the rest of the list
+            if not isinstance(record, dict):
+                _LOGGER.warning("Skipping invalid %s record: %r", kind, record)
+                continue
+            record_id = record.get(id_key)
+            if record_id is None:
+                continue
+            if not isinstance(record_id, Hashable):
+                _LOGGER.warning("Skipping %s record with invalid %s: %r", kind, id_key, record_id)
+                continue
+            _intern_fields(record)
+            previous = store.get(record_id)
+            if previous == record:
+                # Periodic re-announcement of an unchanged record
+                continue
+            store[record_id] = record
+            dirty = True
+            if previous is None:
+                new_ids.append(record_id)
+            _LOGGER.debug(
+                "Discovered %s: %s (%s: %s)",
+                kind,
+                record.get(name_key),
+                id_key,
+                record_id,
+            )
+
+        # Notify that devices have been updated, passing along which light
+        # and group addresses are new so platforms only visit those
+        if dirty and fires_event:
+            if store is self.devices:
+                self._schedule_fire(new_addrs=new_ids)
             else:
-                scenes = payload
-
-            if not isinstance(scenes, list):
-                _LOGGER.warning("Invalid scenes payload format: %s", type(scenes))
-                return
+                self._schedule_fire(new_group_addrs=new_ids)
 
-            _LOGGER.info("Discovered %d scenes", len(scenes))
-
-            for scene in scenes:
-                scene_id = scene.get("scene_id")
-                if scene_id is not None:
-                    self.scenes[scene_id] = scene
-                    _LOGGER.debug(
-                        "Discovered scene: %s (id: %s)",
-                        scene.get("scene_name"),
-                        scene_id,
-                    )
-
-        except (json.JSONDecodeError, KeyError, TypeError) as err:
-            _LOGGER.error("Error parsing scenes message: %s", err)
-
-    def get_device(self, device_addr: int) -> dict[str, Any] | None:
+    def get_device(self, device_addr: int) -> LightRecord | None:
         """Get device information by address."""
         return self.devices.get(device_addr)
 
-    def get_all_devices(self) -> dict[int, dict[str, Any]]:
-        """Get all discovered devices."""
-        return self.devices.copy()
+    def get_all_devices(self) -> Mapping[int, LightRecord]:
+        """Get a read-only view of all discovered devices."""
+        return self._devices_view
 
-    def get_group(self, group_addr: int) -> dict[str, Any] | None:
+    def iter_devices(self) -> ItemsView[int, LightRecord]:
+        """Iterate (device_addr, record) pairs without copying."""
+        return self.devices.items()
+
+    def get_group(self, group_addr: int) -> GroupRecord | None:
         """Get group information by address."""
         return self.groups.get(group_addr)
 
-    def get_all_groups(self) -> dict[int, dict[str, Any]]:
-        """Get all discovered groups."""
-        return self.groups.copy()
+    def get_all_groups(self) -> Mapping[int, GroupRecord]:
+        """Get a read-only view of all discovered groups."""
+        return self._groups_view
+
+    def iter_groups(self) -> ItemsView[int, GroupRecord]:
+        """Iterate (group_addr, record) pairs without copying."""
+        return self.groups.items()
 
-    def get_scene(self, scene_id: int) -> dict[str, Any] | None:
+    def get_scene(self, scene_id: int) -> SceneRecord | None:
         """Get scene information by ID."""
         return self.scenes.get(scene_id)
 
-    def get_all_scenes(self) -> dict[int, dict[str, Any]]:
-        """Get all discovered scenes."""
-        return self.scenes.copy()
+    def get_all_scenes(self) -> Mapping[int, SceneRecord]:
+        """Get a read-only view of all discovered scenes."""
+        return self._scenes_view
 
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
-import json
+from collections import deque
+from collections.abc import Callable, Iterable
 import logging
 import math
+import time
 from datetime import timedelta
 from typing import Any
-import re
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -47,37 +47,87 @@ from .const import (
     TOPIC_SET_GROUP_POWER,
     TOPIC_SET_GROUP_LIGHTNESS,
     TOPIC_SET_GROUP_CTL,
+    TOPIC_SET_GROUP_TEMPERATURE,
+    object_id_from_name,
 )
 from .discovery import HafeleDiscovery
-from .mqtt_client import HafeleMQTTClient
+from .mqtt_client import (
+    EMPTY_PAYLOAD,
+    HafeleMQTTClient,
+    json_loads,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# hass.data key for the child entity_id -> parent mesh groups index
+_PARENT_GROUPS = f"{DOMAIN}_parent_groups"
+
+# Status keys that carry the on/off state when "onoff" is missing, in order
+# of precedence
+_LEGACY_ON_OFF_KEYS = ("onOff", "power", "state")
+_ON_VALUES = frozenset(("on", "ON", "1"))
+
+# Every status key an entity state is derived from
+_STATE_KEYS = frozenset(
+    ("onoff", "onOff", "power", "state", "lightness", "brightness", "level", "temperature")
+)
+_UNSET = object()
+
+# How long a post-command follow-up waits for a pushed status before it
+# sends its own GET
+_MANUAL_UPDATE_WAIT = 4.0  # seconds
+
+# Device types the light platform creates entities for
+_LIGHT_TYPES = frozenset(("light", "multiwhite"))
+
 
-def _suggested_object_id_from_name(name: str) -> str:
-    """Build a Home Assistant object id fragment from a mesh device or group name."""
-    entity_id_base = name.lower().replace(" ", "_").replace("-", "_")
-    return re.sub(r"[^a-z0-9_]", "", entity_id_base).strip("_")
+def _brightness_to_lightness(brightness: int) -> float:
+    """Convert an HA brightness (0-255) to gateway lightness, rounded up to 0.01."""
+    # Integer ceil division: same result as ceil(b / 255 * 100), no float math
+    return -(-int(brightness) * 100 // 255) / 100.0
+
+
+def _ceil_lightness(lightness: float) -> float:
+    """Round a gateway lightness up to 0.01 without float creep.
+
+    ``0.07 * 100`` is ``7.000000000000001``, which a bare ceil turns into
+    0.08; rounding the product first keeps exact hundredths where they are.
+    """
+    return math.ceil(round(lightness * 100, 6)) / 100.0
+
+
+def _light_entity_ids_by_addr(entries: Iterable[er.RegistryEntry]) -> dict[int, str]:
+    """Map device_addr -> entity_id for this integration's registered lights in one pass."""
+    entity_ids: dict[int, str] = {}
+    for entry in entries:
+        if entry.platform != DOMAIN or entry.domain != "light":
+            continue
+        prefix, _, addr = (entry.unique_id or "").partition("_")
+        if prefix == "hafele" and addr.isdigit():
+            entity_ids[int(addr)] = entry.entity_id
+    return entity_ids
 
 
 def _light_entity_id_for_device(
-    entity_registry: er.EntityRegistry,
+    light_entity_ids: dict[int, str],
     device_addr: int,
     dev_info: dict[str, Any],
 ) -> str | None:
-    """Resolve a light entity_id from the registry, falling back to sanitized device name."""
-    unique_id = f"hafele_{device_addr}"
-    entity_id = entity_registry.async_get_entity_id("light", DOMAIN, unique_id)
+    """Resolve a light entity_id from the registry index, falling back to sanitized device name."""
+    entity_id = light_entity_ids.get(device_addr)
     if entity_id:
         return entity_id
     name = dev_info.get("device_name", f"device_{device_addr}").strip()
-    clean_id = _suggested_object_id_from_name(name)
+    clean_id = object_id_from_name(name)
     return f"light.{clean_id}" if clean_id else None
 
 
 class HafeleLightCoordinator(DataUpdateCoordinator):
     """Coordinator for polling Hafele light status."""
 
+    # Set by the platform in rotational polling mode
+    poller: RotationalPoller | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -98,10 +148,18 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
         self.polling_timeout = polling_timeout
         self.polling_mode = polling_mode
         self._status_data: dict[str, Any] = {}
-        self._status_received = False
-        self._unsubscribers: list = []
+        # Set by _on_status_message so a poll resumes as soon as the reply lands
+        self._status_event = asyncio.Event()
+        # Also set on every status, but only ever cleared by the entity's
+        # post-command follow-up, so it never races a poll's wait
+        self.status_seen = asyncio.Event()
+        # Monotonic time of the last status the gateway pushed on its own, i.e.
+        # not as the reply to one of our polls; None once a poll has run
+        self._last_push: float | None = None
+        self._polling = False
+        self._polling_interval = polling_interval
         self.entity: HafeleLightEntity | None = None
-        self.is_multiwhite = any(t.lower() == "multiwhite" for t in device_types)
+        self.is_multiwhite = "multiwhite" in {t.lower() for t in device_types}
 
         status_topic = TOPIC_DEVICE_STATUS.format(
             prefix=topic_prefix, device_name=device_name
@@ -109,6 +167,10 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
 
         self.response_topics = [status_topic]
         self._device_name = device_name
+        # Poll topic is fixed per device; format it once instead of every update
+        self._get_lightness_topic = (
+            TOPIC_GET_DEVICE_CTL if self.is_multiwhite else TOPIC_GET_DEVICE_LIGHTNESS
+        ).format(prefix=topic_prefix, device_name=device_name)
 
         update_interval = (
             timedelta(seconds=polling_interval)
@@ -130,33 +192,32 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
             name=f"hafele_light_{device_addr}",
             update_interval=update_interval,
         )
+        # Start from the (empty) status dict rather than None; data and
+        # _status_data always name the same dict
+        self.data: dict[str, Any] = self._status_data
 
-    async def _async_setup_subscriptions(self) -> None:
-        """Set up MQTT subscriptions for status responses."""
-        for topic in self.response_topics:
-            unsub = await self.mqtt_client.async_subscribe(
-                topic, self._on_status_message
-            )
-            if unsub:
-                self._unsubscribers.append(unsub)
-
-    async def _async_shutdown(self) -> None:
-        """Clean up subscriptions."""
-        for unsub in self._unsubscribers:
-            if callable(unsub):
-                if inspect.iscoroutinefunction(unsub):
-                    await unsub()
-                else:
-                    unsub()
-        self._unsubscribers.clear()
-        await super()._async_shutdown()
+    @callback
+    def async_set_optimistic(self, changes: dict[str, Any]) -> None:
+        """Apply a command's expected state as a new dict, like a status would.
+
+        Copy-on-write here too, so a dict already handed out is never mutated
+        by a later command; listeners are not notified, the commanding entity
+        writes its own state.
+        """
+        self._status_data = self.data = {**(self.data or {}), **changes}
 
     @callback
     def _on_status_message(self, topic: str, payload: Any) -> None:
-        """Handle status response message."""
+        """Handle a status message from an MQTT subscription callback."""
+        self._handle_status(payload)
+
+    @callback
+    def _handle_status(self, payload: Any) -> None:
+        """Handle a status payload; the topic is always this device's."""
         try:
-            if isinstance(payload, str):
-                data = json.loads(payload)
+            if isinstance(payload, (str, bytes, bytearray)):
+                # orjson parses bytes directly; no decode to str first
+                data = json_loads(payload)
             else:
                 data = payload
             if "lightness" in data:
@@ -164,15 +225,44 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
                     data["onoff"] = 1
                 else:
                     data["onoff"] = 0
-                _LOGGER.debug(f'Updating onoff to {data["onoff"]} due to lightness {data["lightness"]}')
+                _LOGGER.debug(
+                    "Updating onoff to %s due to lightness %s",
+                    data["onoff"],
+                    data["lightness"],
+                )
 
+            changed = True
             if isinstance(data, dict) and isinstance(self._status_data, dict):
-                self._status_data.update(data)
-                merged_data = self._status_data
+                previous = self._status_data
+                changed = any(
+                    key in _STATE_KEYS and previous.get(key, _UNSET) != value
+                    for key, value in data.items()
+                )
+                if changed:
+                    # Copy-on-write: the dict already handed to HA is never
+                    # mutated by a later message, so readers see a whole snapshot
+                    merged_data = {**previous, **data}
+                    self._status_data = merged_data
+                else:
+                    merged_data = previous
             else:
                 self._status_data = data
                 merged_data = data
-            self._status_received = True
+            # A reply is a reply, changed or not; release any waiting poll
+            self._status_event.set()
+            self.status_seen.set()
+            if not self._polling:
+                self._last_push = time.monotonic()
+            if not changed:
+                # Keep-alive or repeated status: nothing any entity shows moved,
+                # so don't wake the coordinator's listeners
+                _LOGGER.debug(
+                    "Unchanged status for device %s (name: %s): %s",
+                    self.device_addr,
+                    self.device_name,
+                    data,
+                )
+                return
             _LOGGER.debug(
                 "Received status for device %s (name: %s): %s (merged: %s)",
                 self.device_addr,
@@ -183,9 +273,13 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
             self.async_set_updated_data(merged_data)
 
             if self.entity and self.entity.hass:
-                self.entity.hass.async_create_task(self.entity.async_update_parent_groups())
+                # Parent group recalculation never suspends; run it eagerly
+                # instead of paying an event-loop round trip per status message
+                self.entity.hass.async_create_task(
+                    self.entity.async_update_parent_groups(), eager_start=True
+                )
 
-        except (json.JSONDecodeError, TypeError) as err:
+        except (ValueError, TypeError) as err:
             _LOGGER.error(
                 "Error parsing status message for device %s: %s",
                 self.device_addr,
@@ -194,41 +288,84 @@ class HafeleLightCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch status from device via MQTT polling."""
-        if self.is_multiwhite:
-            _type = "Multiwhite"
-            get_lightness_topic = TOPIC_GET_DEVICE_CTL.format(
-                prefix=self.topic_prefix, device_name=self._device_name
-            )
-        else:
-            _type = "Monochrome"
-            get_lightness_topic = TOPIC_GET_DEVICE_LIGHTNESS.format(
-                prefix=self.topic_prefix, device_name=self._device_name
+        if (
+            self.polling_mode == POLLING_MODE_NORMAL
+            and self._last_push is not None
+            and time.monotonic() - self._last_push < self._polling_interval
+        ):
+            # A pushed status already refreshed the data this interval; the
+            # scheduled poll only acts as a keepalive for missed pushes
+            _LOGGER.debug(
+                "Skipping poll for device %s, status pushed %.1fs ago",
+                self.device_addr,
+                time.monotonic() - self._last_push,
             )
+            return self._status_data if isinstance(self._status_data, dict) else {}
+
+        _type = "Multiwhite" if self.is_multiwhite else "Monochrome"
+        get_lightness_topic = self._get_lightness_topic
         _LOGGER.debug(
             "Requesting lightness status for %s device %s (name: %s) on topic: %s", _type,
             self.device_addr, self.device_name, get_lightness_topic)
 
-        self._status_received = False
-        old_data = self._status_data.copy() if isinstance(self._status_data, dict) else {}
-
-        await self.mqtt_client.async_publish(get_lightness_topic, {}, qos=1)
-
-        timeout = self.polling_timeout
-        elapsed = 0
-        while not self._status_received and elapsed < timeout:
-            await asyncio.sleep(0.1)
-            elapsed += 0.1
+        self._status_event.clear()
 
-        if not self._status_received:
+        self._polling = True
+        try:
+            await self.mqtt_client.async_publish(get_lightness_topic, EMPTY_PAYLOAD, qos=1)
+            # asyncio.timeout waits in this task; wait_for would wrap the
+            # event wait in a task of its own on every poll
+            async with asyncio.timeout(self.polling_timeout):
+                await self._status_event.wait()
+        except TimeoutError:
             _LOGGER.warning(
                 "Timeout waiting for status response from device %s",
                 self.device_addr,
             )
-            return old_data if old_data else {}
+            # Nothing arrived, so the last merged status is still current
+            return self._status_data if isinstance(self._status_data, dict) else {}
+        finally:
+            self._polling = False
+            self._last_push = None
 
         return self._status_data if isinstance(self._status_data, dict) else {}
 
 
+class LightStatusDispatcher:
+    """Route one wildcard light status subscription to per-device coordinators.
+
+    Subscribes ``{prefix}/lights/+/status`` once and hands each message to
+    the coordinator whose device name sits in the ``+`` level. ``+`` only
+    matches a single topic level, so devices whose name contains ``/`` need
+    their own exact subscription feeding ``dispatch`` (see ``needs_exact``).
+    """
+
+    def __init__(self, topic_prefix: str) -> None:
+        """Initialize the dispatcher for a topic prefix."""
+        self.topic = TOPIC_DEVICE_STATUS.format(prefix=topic_prefix, device_name="+")
+        self._head, self._tail = self.topic.split("+")
+        # device name -> bound status handler, resolved once per coordinator
+        self._handlers: dict[str, Callable[[Any], None]] = {}
+
+    def add(self, coordinator: HafeleLightCoordinator) -> None:
+        """Start routing status for a coordinator's device."""
+        self._handlers[coordinator.device_name] = coordinator._handle_status
+
+    @staticmethod
+    def needs_exact(device_name: str) -> bool:
+        """Return whether a device's status topic falls outside the wildcard."""
+        return "/" in device_name
+
+    @callback
+    def dispatch(self, topic: str, payload: Any) -> None:
+        """Hand a status message to the coordinator named in its topic."""
+        if not (topic.startswith(self._head) and topic.endswith(self._tail)):
+            return
+        handler = self._handlers.get(topic[len(self._head) : -len(self._tail)])
+        if handler is not None:
+            handler(payload)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -249,32 +386,79 @@ async def async_setup_entry(
     created_entities: set[int] = set()
     created_groups: set[int] = set()
     coordinators: dict[int, HafeleLightCoordinator] = {}
-    entity_registry = er.async_get(hass)
+    poller = (
+        RotationalPoller(coordinators, polling_interval)
+        if polling_mode == POLLING_MODE_ROTATIONAL
+        else None
+    )
+
+    # One wildcard subscription serves every light's status topic
+    status_dispatcher = LightStatusDispatcher(topic_prefix)
+    entry.async_on_unload(
+        await mqtt_client.async_subscribe(status_dispatcher.topic, status_dispatcher.dispatch)
+    )
 
-    async def _create_entities_for_devices_and_groups() -> None:
-        """Create entities for all discovered light devices and groups."""
+    async def _async_subscribe_exact_status(topic: str) -> None:
+        """Subscribe one status topic the wildcard subscription can't match."""
+        entry.async_on_unload(
+            await mqtt_client.async_subscribe(topic, status_dispatcher.dispatch)
+        )
+
+    @callback
+    def _create_entities_for_devices_and_groups(
+        device_addrs: Iterable[int] | None = None,
+        group_addrs: Iterable[int] | None = None,
+    ) -> None:
+        """Create entities for discovered light devices and groups.
+
+        Scans everything discovery knows when both address lists are None
+        (initial setup), otherwise only the given device and group addresses.
+        """
         new_entities = []
+        full_scan = device_addrs is None and group_addrs is None
 
-        devices = discovery.get_all_devices()
-        for device_addr, device_info in devices.items():
-            if device_addr in created_entities:
-                continue
-            
-            unique_id = f"hafele_{device_addr}"
-            existing_entity_id = entity_registry.async_get_entity_id(
-                "light", DOMAIN, unique_id
-            )
-            if existing_entity_id:
-                _LOGGER.debug(
-                    "Entity already exists for device %s (addr: %s, entity_id: %s), restoring",
-                    device_info.get("device_name"),
-                    device_addr,
-                    existing_entity_id,
-                )
+        if full_scan:
+            # Nothing in this pass awaits, so the live view can't change under us
+            devices = discovery.iter_devices()
+            groups = discovery.iter_groups()
+        else:
+            devices = [
+                (addr, device_info)
+                for addr in device_addrs or ()
+                if (device_info := discovery.get_device(addr)) is not None
+            ]
+            groups = [
+                (addr, group_info)
+                for addr in group_addrs or ()
+                if (group_info := discovery.get_group(addr)) is not None
+            ]
+
+        # Drop everything already created before doing any per-item work; on a
+        # rediscovery that is usually every device and group
+        devices = [(addr, info) for addr, info in devices if addr not in created_entities]
+        groups = (
+            [
+                (addr, info)
+                for addr, info in groups
+                if addr not in created_groups and info.get("group_name")
+            ]
+            if enable_groups
+            else []
+        )
+        if not devices and not groups:
+            return
+
+        # One pass over this entry's registry entries (HA indexes them by
+        # config entry) serves both the device and the group loops
+        entity_registry = er.async_get(hass)
+        light_entity_ids = _light_entity_ids_by_addr(
+            er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+        )
 
+        for device_addr, device_info in devices:
             device_types = device_info.get("device_types", [])
 
-            if device_types and not any(t.lower() in ("light", "multiwhite") for t in device_types):
+            if device_types and _LIGHT_TYPES.isdisjoint({t.lower() for t in device_types}):
                 _LOGGER.debug(
                     "Skipping device %s (addr: %s) - not a light type",
                     device_info.get("device_name"),
@@ -282,6 +466,15 @@ async def async_setup_entry(
                 )
                 continue
 
+            existing_entity_id = light_entity_ids.get(device_addr)
+            if existing_entity_id:
+                _LOGGER.debug(
+                    "Entity already exists for device %s (addr: %s, entity_id: %s), restoring",
+                    device_info.get("device_name"),
+                    device_addr,
+                    existing_entity_id,
+                )
+
             _LOGGER.info(
                 "Creating light entity for device: %s (addr: %s)",
                 device_info.get("device_name"),
@@ -302,43 +495,45 @@ async def async_setup_entry(
                 device_types,
             )
 
-            await coordinator._async_setup_subscriptions()
+            status_dispatcher.add(coordinator)
+            if status_dispatcher.needs_exact(device_name):
+                hass.async_create_task(
+                    _async_subscribe_exact_status(coordinator.response_topics[0])
+                )
 
             entity = HafeleLightEntity(
                 coordinator, device_addr, device_info, mqtt_client, topic_prefix
             )
 
             coordinator.entity = entity
+            coordinator.poller = poller
             coordinators[device_addr] = coordinator
 
             new_entities.append(entity)
             created_entities.add(device_addr)
 
-            suggested_object_id = _suggested_object_id_from_name(device_name)
-            entity_registry.async_get_or_create(
-                "light", DOMAIN, entity.unique_id, suggested_object_id=suggested_object_id
-            )
-
-        if enable_groups:
-            discovered_groups = discovery.get_all_groups()
-            for group_addr, group_info in discovered_groups.items():
-                if group_addr in created_groups:
-                    continue
-
-                group_name = group_info.get("group_name")
-                if not group_name:
-                    continue
-
-                member_device_addresses = group_info.get("devices", [])
-                child_entity_ids: list[str] = []
-                for addr in member_device_addresses:
-                    dev_info = discovery.get_device(addr)
-                    if dev_info:
-                        entity_id = _light_entity_id_for_device(
-                            entity_registry, addr, dev_info
-                        )
-                        if entity_id:
-                            child_entity_ids.append(entity_id)
+            if groups and device_addr not in light_entity_ids:
+                # Groups in this pass need the light's real entity_id; only the
+                # registry knows whether the name-derived one was already taken
+                light_entity_ids[device_addr] = entity_registry.async_get_or_create(
+                    "light",
+                    DOMAIN,
+                    entity.unique_id,
+                    suggested_object_id=object_id_from_name(device_name) or None,
+                ).entity_id
+
+        if groups:
+            get_device = discovery.get_device
+            for group_addr, group_info in groups:
+                group_name = group_info["group_name"]
+
+                # Resolve members straight to entity_ids in the same pass
+                child_entity_ids: list[str] = [
+                    entity_id
+                    for addr in group_info.get("devices", ())
+                    if (dev_info := get_device(addr))
+                    and (entity_id := _light_entity_id_for_device(light_entity_ids, addr, dev_info))
+                ]
 
                 _LOGGER.info(
                     "Creating native group: %s (addr: %s) mapping to entities: %s",
@@ -353,15 +548,10 @@ async def async_setup_entry(
                 new_entities.append(group_entity)
                 created_groups.add(group_addr)
 
-                suggested_group_obj_id = _suggested_object_id_from_name(group_name)
-                entity_registry.async_get_or_create(
-                    "light",
-                    DOMAIN,
-                    group_entity.unique_id,
-                    suggested_object_id=suggested_group_obj_id,
-                )
-
         if new_entities:
+            # The entity platform registers every entity not pre-registered
+            # above (groups, and lights no group in this pass tracks) with its
+            # suggested_object_id
             _LOGGER.info("Adding %d light entities", len(new_entities))
             async_add_entities(new_entities, update_before_add=False)
             _LOGGER.info("Finished adding %d light entities", len(new_entities))
@@ -369,71 +559,29 @@ async def async_setup_entry(
     @callback
     def _on_devices_updated(event) -> None:
         """Handle device discovery update event."""
-        hass.async_create_task(_create_entities_for_devices_and_groups())
+        new_addrs = event.data.get("new_addrs")
+        new_group_addrs = event.data.get("new_group_addrs")
+        if new_addrs or new_group_addrs:
+            # Entity creation never awaits, so run it inline with the event
+            # rather than paying for a task per discovery burst
+            _create_entities_for_devices_and_groups(new_addrs or [], new_group_addrs or [])
 
     entry.async_on_unload(
         hass.bus.async_listen(EVENT_DEVICES_UPDATED, _on_devices_updated)
     )
 
-    await _create_entities_for_devices_and_groups()
+    _create_entities_for_devices_and_groups()
+
+    if poller is not None:
 
-    if polling_mode == POLLING_MODE_ROTATIONAL:
         async def _rotational_polling_loop() -> None:
             """Rotational Polling with Fine-Grained PollPriority and sleep after each update."""
-            rr_index = 0
             _LOGGER.debug("Starting rational polling loop")
             await hass.async_block_till_done()
             _LOGGER.info("Homeassistant started - we start polling")
             while True:
                 try:
-                    entity = None
-                    is_high = False
-                    normal_entities = []
-
-                    for c in coordinators.values():
-                        e = c.entity
-                        if e is None:
-                            continue
-                        if e.priority == PollPriority.HIGH:
-                            entity = e
-                            is_high = True
-                            break
-                        normal_entities.append(e)
-
-                    if entity is None and normal_entities:
-                        entity = normal_entities[rr_index % len(normal_entities)]
-
-                    if entity is None:
-                        _LOGGER.warning("No entities found to poll")
-                        await asyncio.sleep(polling_interval)
-                        continue
-
-                    try:
-                        if is_high:
-                            _LOGGER.debug(
-                                "Updating HIGH priority entity: %s (%s)",
-                                entity.device_name,
-                                entity.device_addr,
-                            )
-                            await entity.coordinator.async_request_refresh()
-                            entity.reset_priority()
-                        else:
-                            _LOGGER.debug(
-                                "Updating NORMAL priority entity: %s (%s)",
-                                entity.device_name,
-                                entity.device_addr,
-                            )
-                            await entity.coordinator.async_request_refresh()
-                            rr_index += 1
-                    except Exception as e:
-                        _LOGGER.exception(
-                            "Error updating %s entity %s: %s",
-                            "HIGH" if is_high else "normal",
-                            entity.device_name,
-                            e,
-                        )
-                    await asyncio.sleep(polling_interval)
-
+                    await poller.async_run_cycle()
                 except Exception as cycle_error:
                     _LOGGER.exception(f"Critical error in polling cycle: {cycle_error}")
                     await asyncio.sleep(polling_interval)
@@ -453,47 +601,94 @@ class PollPriority:
     HIGH = 1
 
 
-async def run_one_rotational_polling_cycle(
-    coordinators: dict[int, "HafeleLightCoordinator"],
-    rr_index: int,
-    polling_interval: int,
-) -> int:
-    """Run one cycle of rotational polling."""
-    high_priority_entities: list[HafeleLightEntity] = []
-    normal_entities: list[HafeleLightEntity] = []
-    for c in coordinators.values():
-        entity = c.entity
-        if entity is None:
-            continue
-        if entity.priority == PollPriority.HIGH:
-            high_priority_entities.append(entity)
-        else:
-            normal_entities.append(entity)
-    if not high_priority_entities and not normal_entities:
-        await asyncio.sleep(polling_interval)
-        return rr_index
-    for entity in high_priority_entities:
-        try:
-            await entity.coordinator.async_request_refresh()
-            entity.reset_priority()
-        except Exception as e:
-            _LOGGER.exception(
-                "Error updating HIGH priority entity %s: %s",
-                entity.device_name, e,
-            )
-        await asyncio.sleep(polling_interval)
-    if normal_entities:
-        entity = normal_entities[rr_index % len(normal_entities)]
-        try:
-            await entity.coordinator.async_request_refresh()
-            rr_index += 1
-        except Exception as e:
-            _LOGGER.exception(
-                "Error updating normal entity %s: %s",
-                entity.device_name, e,
-            )
-        await asyncio.sleep(polling_interval)
-    return rr_index
+class RotationalPoller:
+    """Poll light coordinators one at a time from a rotating queue.
+
+    Each cycle refreshes every HIGH priority entity first, then the next
+    NORMAL entity in the rotation. Refreshes start ``polling_interval``
+    apart, so the mesh only ever sees one request in flight; the time a
+    refresh spends waiting for its reply counts towards that interval.
+    """
+
+    def __init__(
+        self,
+        coordinators: dict[int, HafeleLightCoordinator],
+        polling_interval: int,
+    ) -> None:
+        """Initialize the poller over the platform's live coordinator dict."""
+        self._coordinators = coordinators
+        self.polling_interval = polling_interval
+        self._queue: deque[int] = deque(coordinators)
+        # Insertion-ordered set of addresses waiting for a HIGH priority refresh;
+        # kept by the entities so a cycle never scans every coordinator for them
+        self._high_priority: dict[int, None] = {}
+
+    def mark_high_priority(self, device_addr: int) -> None:
+        """Queue a device for a refresh ahead of the normal rotation."""
+        self._high_priority[device_addr] = None
+
+    def update_targets(self, device_addrs: Iterable[int]) -> None:
+        """Sync the rotation with a set of addresses, keeping the current order."""
+        wanted = dict.fromkeys(device_addrs)
+        self._queue = deque(
+            [addr for addr in self._queue if addr in wanted]
+            + [addr for addr in wanted if addr not in self._queue]
+        )
+
+    async def async_run_cycle(self) -> None:
+        """Run one polling cycle."""
+        if len(self._queue) != len(self._coordinators):
+            # The platform adds coordinators as devices are discovered
+            self.update_targets(self._coordinators)
+
+        loop = asyncio.get_running_loop()
+        polled = False
+        refreshed: set[int] = set()
+        for device_addr in list(self._high_priority):
+            # Dequeue first; a command during the refresh queues it again
+            self._high_priority.pop(device_addr, None)
+            coordinator = self._coordinators.get(device_addr)
+            entity = coordinator.entity if coordinator else None
+            if entity is None:
+                continue
+            polled = True
+            refreshed.add(device_addr)
+            deadline = loop.time() + self.polling_interval
+            try:
+                await entity.coordinator.async_request_refresh()
+                entity.reset_priority()
+            except Exception as e:
+                _LOGGER.exception(
+                    "Error updating HIGH priority entity %s: %s",
+                    entity.device_name, e,
+                )
+            # Sleep out the rest of the slot; nothing if the refresh overran
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+        # Rotate before refreshing so a failing device can't stall the rotation
+        for _ in range(len(self._queue)):
+            device_addr = self._queue[0]
+            self._queue.rotate(-1)
+            coordinator = self._coordinators.get(device_addr)
+            entity = coordinator.entity if coordinator else None
+            if entity is None or device_addr in refreshed or device_addr in self._high_priority:
+                continue
+            polled = True
+            deadline = loop.time() + self.polling_interval
+            try:
+                await entity.coordinator.async_request_refresh()
+            except Exception as e:
+                _LOGGER.exception(
+                    "Error updating normal entity %s: %s",
+                    entity.device_name, e,
+                )
+            # Sleep out the rest of the slot; nothing if the refresh overran
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            break
+
+        if not polled:
+            _LOGGER.warning("No entities found to poll")
+            await asyncio.sleep(self.polling_interval)
 
 
 class HafeleLightEntity(CoordinatorEntity, LightEntity):
@@ -517,7 +712,7 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
         self._attr_name = device_info.get("device_name", f"Hafele Light {device_addr}")
 
         device_types = device_info.get("device_types", [])
-        self._is_multiwhite = any(t.lower() == "multiwhite" for t in device_types)
+        self._is_multiwhite = "multiwhite" in {t.lower() for t in device_types}
         self._attr_color_mode = (
             ColorMode.COLOR_TEMP if self._is_multiwhite else ColorMode.BRIGHTNESS
         )
@@ -528,11 +723,28 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
 
         device_name = device_info.get("device_name", f"device_{device_addr}")
         self._device_name = device_name
+
+        # Command topics are fixed per device; format them once
+        self._power_topic = TOPIC_SET_DEVICE_POWER.format(
+            prefix=topic_prefix, device_name=device_name
+        )
+        self._lightness_topic = TOPIC_SET_DEVICE_LIGHTNESS.format(
+            prefix=topic_prefix, device_name=device_name
+        )
+        self._ctl_topic = TOPIC_SET_DEVICE_CTL.format(
+            prefix=topic_prefix, device_name=device_name
+        )
+        self._get_lightness_topic = (
+            TOPIC_GET_DEVICE_CTL if self._is_multiwhite else TOPIC_GET_DEVICE_LIGHTNESS
+        ).format(prefix=topic_prefix, device_name=device_name)
         
         self._last_known_lightness: float | None = None
         self._last_known_color_temp: int = 2700
 
         self._priority = PollPriority.NORMAL
+        self._manual_update_task: asyncio.Task | None = None
+        # (is_on, brightness, color_temp_kelvin) while a state write is in progress
+        self._state_snapshot: tuple[bool, int | None, int | None] | None = None
 
         location = device_info.get("location", "Unknown")
 
@@ -545,6 +757,11 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
         )
         _LOGGER.info(f"initiated {self} - multiwhite: {self._is_multiwhite}")
 
+    @property
+    def suggested_object_id(self) -> str | None:
+        """Object id Home Assistant registers on first add, derived from the mesh name."""
+        return object_id_from_name(self._device_name) or None
+
     @property
     def device_name(self) -> str:
         return self._device_name
@@ -559,6 +776,8 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
 
     def set_high_priority(self):
         self._priority = PollPriority.HIGH
+        if (poller := self.coordinator.poller) is not None:
+            poller.mark_high_priority(self.device_addr)
 
     def reset_priority(self):
         self._priority = PollPriority.NORMAL
@@ -571,102 +790,157 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
     def max_color_temp_kelvin(self) -> int:
         return 5000
 
-    @property
-    def is_on(self) -> bool:
-        """Return if the light is on."""
-        if not self.coordinator.data:
+    def _read_is_on(self) -> bool:
+        """Parse the on/off state from the coordinator data."""
+        status = self.coordinator.data
+        if not status:
             return False
 
-        status = self.coordinator.data
         if isinstance(status, dict):
-            onoff = status.get("onoff")
-            if onoff is not None:
-                return bool(onoff) if isinstance(onoff, (int, float)) else onoff in ("on", "ON", True, 1, "1")
-            
-            on_off = status.get("onOff")
-            if on_off is not None:
-                if isinstance(on_off, (int, float)):
-                    return bool(on_off)
-                return on_off in ("on", "ON", True, 1, "1")
-            
-            power = status.get("power")
-            if power is not None:
-                if isinstance(power, (int, float)):
-                    return bool(power)
-                return power in ("on", "ON", True, 1, "1")
-            state = status.get("state")
-            if state is not None:
-                if isinstance(state, (int, float)):
-                    return bool(state)
-                return state in ("on", "ON", True, 1, "1")
+            # The gateway reports "onoff"; other keys are only looked at when
+            # it is missing, the first one present winning
+            value = status.get("onoff")
+            if value is None:
+                for key in _LEGACY_ON_OFF_KEYS:
+                    value = status.get(key)
+                    if value is not None:
+                        break
+                else:
+                    return False
+            if isinstance(value, (int, float)):
+                return bool(value)
+            return isinstance(value, str) and value in _ON_VALUES
 
         return False
 
-    @property
-    def color_temp_kelvin(self) -> int | None:
-        """Return the color_temperature of the light."""
+    def _read_color_temp_kelvin(self) -> int | None:
+        """Parse the colour temperature from the coordinator data."""
         if not self._is_multiwhite:
             return None
-        if not self.coordinator.data:
-            return None
         status = self.coordinator.data
+        if not status:
+            return None
         if isinstance(status, dict):
             temp_kelvin = status.get("temperature")
             if temp_kelvin is not None:
                 return min(max(temp_kelvin, 2700), 5000)
         return 2700
 
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light."""
-        if not self.coordinator.data:
-            return 0
+    def _parse_brightness(self) -> tuple[int, float] | None:
+        """Parse (brightness, lightness) from the coordinator data, None if absent.
 
+        Pure: remembering the level for a later bare turn_on is left to
+        async_write_ha_state, which only does so for a lit state.
+        """
         status = self.coordinator.data
-        if isinstance(status, dict):
-            lightness = status.get("lightness")
-            if lightness is not None:
-                if isinstance(lightness, (int, float)):
-                    lightness_float = float(lightness)
-                    self._last_known_lightness = lightness_float
-                    return int(lightness_float * 255)
-            brightness = status.get("brightness")
-            if brightness is not None:
-                if isinstance(brightness, (int, float)):
-                    if brightness > 255:
-                        brightness_value = int((brightness / 100) * 255)
-                    else:
-                        brightness_value = int(brightness)
-                    self._last_known_lightness = brightness_value / 255.0
-                    return brightness_value
-            level = status.get("level")
-            if level is not None:
-                if isinstance(level, (int, float)):
-                    if level > 255:
-                        level_value = int((level / 100) * 255)
-                    else:
-                        level_value = int(level)
-                    self._last_known_lightness = level_value / 255.0
-                    return level_value
+        if not status or not isinstance(status, dict):
+            return None
 
+        lightness = status.get("lightness")
+        if isinstance(lightness, (int, float)):
+            lightness_float = float(lightness)
+            return int(lightness_float * 255), lightness_float
+        for key in ("brightness", "level"):
+            value = status.get(key)
+            if isinstance(value, (int, float)):
+                if value > 255:
+                    brightness_value = int((value / 100) * 255)
+                else:
+                    brightness_value = int(value)
+                return brightness_value, brightness_value / 255.0
+        return None
+
+    def _read_brightness(self) -> int | None:
+        """Parse the brightness from the coordinator data."""
+        if not self.coordinator.data:
+            return 0
+        if (parsed := self._parse_brightness()) is not None:
+            return parsed[0]
         if self._last_known_lightness is not None:
             return int(self._last_known_lightness * 255)
         return 0
 
+    @property
+    def is_on(self) -> bool:
+        """Return if the light is on."""
+        if (snapshot := self._state_snapshot) is not None:
+            return snapshot[0]
+        return self._read_is_on()
+
+    @property
+    def brightness(self) -> int | None:
+        """Return the brightness of the light."""
+        if (snapshot := self._state_snapshot) is not None:
+            return snapshot[1]
+        return self._read_brightness()
+
+    @property
+    def color_temp_kelvin(self) -> int | None:
+        """Return the color_temperature of the light."""
+        if (snapshot := self._state_snapshot) is not None:
+            return snapshot[2]
+        return self._read_color_temp_kelvin()
+
+    def _read_state(self) -> tuple[bool, int | None, int | None]:
+        """Parse (is_on, brightness, color_temp_kelvin) from the coordinator data."""
+        return (
+            self._read_is_on(),
+            self._read_brightness(),
+            self._read_color_temp_kelvin(),
+        )
+
+    async def _async_write_if_changed(self, before: tuple[bool, int | None, int | None]) -> None:
+        """Write an optimistic update and notify parent groups, unless it changed nothing.
+
+        Repeating a command (ON on a light that is already on) leaves the
+        parsed state as it was; the command is still sent and followed up.
+        Parsing is side-effect free, so the comparison itself never touches
+        the remembered level. An off light shows no brightness or colour, so
+        off-to-off is unchanged whatever the stored lightness says.
+        """
+        after = self._read_state()
+        if after == before or not (after[0] or before[0]):
+            return
+        self.async_write_ha_state()
+        await self.async_update_parent_groups()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, parsing the coordinator data once for the whole write.
+
+        HA reads is_on, brightness and color_temp_kelvin several times while
+        building one state. Coordinator updates and the optimistic writes from
+        commands and parent groups all come through here, so a snapshot taken
+        per write never goes stale.
+        """
+        self._state_snapshot = self._read_state()
+        # Only a lit, non-zero level is worth restoring; an off status or
+        # turn_off reports lightness 0.0 and must not overwrite it
+        if self._state_snapshot[0] and (parsed := self._parse_brightness()) and parsed[1] > 0:
+            self._last_known_lightness = parsed[1]
+        try:
+            super().async_write_ha_state()
+        finally:
+            self._state_snapshot = None
+
     async def async_update_parent_groups(self) -> None:
         """Find and tell any parent group containing this light to instantly recalculate state."""
-        for entity in self.hass.data["light"].entities:
-            if isinstance(entity, HafeleMeshLightGroup) and self.entity_id in entity.tracking_child_ids:
-                entity.async_update_group_state_from_children()
+        # Indexed by child entity_id, so this never scans every light entity
+        parents = self.hass.data.get(_PARENT_GROUPS)
+        if not parents:
+            return
+        for group in parents.get(self.entity_id, ()):
+            group.async_update_group_state_from_children()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
+        before = self._read_state()
         # --- MULTIWHITE ---
         if self._is_multiwhite:
             _LOGGER.info(f"Multiwhite {self} turned on")
             if ATTR_BRIGHTNESS in kwargs:
                 brightness = kwargs[ATTR_BRIGHTNESS]
-                lightness = math.ceil((brightness / 255.0) * 100) / 100.0
+                lightness = _brightness_to_lightness(brightness)
                 self._last_known_lightness = lightness
             else:
                 lightness = self._last_known_lightness or 1.0
@@ -679,119 +953,96 @@ class HafeleLightEntity(CoordinatorEntity, LightEntity):
                 "lightness": lightness,
                 "temperature": self._last_known_color_temp,
             }
-            topic_ctl = TOPIC_SET_DEVICE_CTL.format(
-                prefix=self.topic_prefix, device_name=self._device_name
+            await self.mqtt_client.async_publish(self._ctl_topic, payload_ctl, qos=1)
+            self.coordinator.async_set_optimistic(
+                {
+                    "onoff": 1,
+                    "lightness": lightness,
+                    "temperature": self._last_known_color_temp,
+                }
             )
 
-            await self.mqtt_client.async_publish(topic_ctl, payload_ctl, qos=1)
-            state_update = {
-                "onoff": 1,
-                "lightness": lightness,
-                "temperature": self._last_known_color_temp,
-            }
-            if self.coordinator.data:
-                self.coordinator.data.update(state_update)
-            else:
-                self.coordinator.data = state_update
-
             self._attr_color_mode = ColorMode.COLOR_TEMP
         else:
             _LOGGER.info(f"Monochrome {self} turned on")
             # --- Monochrome ---
-            power_topic = TOPIC_SET_DEVICE_POWER.format(
-                prefix=self.topic_prefix, device_name=self._device_name
-            )
-
-            power_command = True
-
             if ATTR_BRIGHTNESS in kwargs:
-                brightness = kwargs[ATTR_BRIGHTNESS]
-                lightness_value = brightness / 255.0
-                lightness_value = math.ceil(lightness_value * 100) / 100.0
+                lightness_value = _brightness_to_lightness(kwargs[ATTR_BRIGHTNESS])
                 self._last_known_lightness = lightness_value
+            elif self._last_known_lightness is not None:
+                lightness_value = _ceil_lightness(self._last_known_lightness)
+            else:
+                lightness_value = None
 
-                await self.mqtt_client.async_publish(power_topic, power_command, qos=1)
-
-                lightness_topic = TOPIC_SET_DEVICE_LIGHTNESS.format(
-                    prefix=self.topic_prefix, device_name=self._device_name
+            if lightness_value is None:
+                await self.mqtt_client.async_publish(self._power_topic, True, qos=1)
+            else:
+                # Power and lightness are independent writes; overlap them
+                await asyncio.gather(
+                    self.mqtt_client.async_publish(self._power_topic, True, qos=1),
+                    self.mqtt_client.async_publish(
+                        self._lightness_topic, {"lightness": lightness_value}, qos=1
+                    ),
                 )
-                lightness_command = {"lightness": lightness_value}
-                await self.mqtt_client.async_publish(lightness_topic, lightness_command, qos=1)
 
-                state_update = {"onoff": 1, "lightness": lightness_value}
-                if self.coordinator.data:
-                    self.coordinator.data.update(state_update)
-                else:
-                    self.coordinator.data = state_update
-            else:
-                if self._last_known_lightness is not None:
-                    lightness_value = self._last_known_lightness
-                    lightness_value = math.ceil(lightness_value * 100) / 100.0
-                    
-                    await self.mqtt_client.async_publish(power_topic, power_command, qos=1)
-                    
-                    lightness_topic = TOPIC_SET_DEVICE_LIGHTNESS.format(
-                        prefix=self.topic_prefix, device_name=self._device_name
-                    )
-                    lightness_command = {"lightness": lightness_value}
-                    await self.mqtt_client.async_publish(lightness_topic, lightness_command, qos=1)
-                    
-                    state_update = {"onoff": 1, "lightness": lightness_value}
-                    if self.coordinator.data:
-                        self.coordinator.data.update(state_update)
-                    else:
-                        self.coordinator.data = state_update
-                else:
-                    await self.mqtt_client.async_publish(power_topic, power_command, qos=1)
-                    
-                    if self.coordinator.data:
-                        self.coordinator.data.update({"onoff": 1})
-                    else:
-                        self.coordinator.data = {"onoff": 1}
+            self.coordinator.async_set_optimistic(
+                {"onoff": 1}
+                if lightness_value is None
+                else {"onoff": 1, "lightness": lightness_value}
+            )
 
-        self.async_write_ha_state()
-        await self.async_update_parent_groups()
-        self.coordinator.hass.async_create_task(self.force_manual_update())
+        await self._async_write_if_changed(before)
+        self._schedule_manual_update()
+
+    def _schedule_manual_update(self) -> None:
+        """Schedule the post-command status refresh, replacing any still pending.
+
+        Rapid commands (e.g. dragging a brightness slider) would otherwise
+        queue one delayed refresh each; only the last one matters.
+        """
+        if self._manual_update_task is not None and not self._manual_update_task.done():
+            self._manual_update_task.cancel()
+        self._manual_update_task = self.coordinator.hass.async_create_task(
+            self.force_manual_update()
+        )
 
     async def force_manual_update(self) -> None:
         """After a change - try requesting actual value either per forced mqtt update or via PollPriority."""
         await asyncio.sleep(1.0)
         self.set_high_priority()
         if self.coordinator.polling_mode == POLLING_MODE_NORMAL:
-            await asyncio.sleep(4.0)
-            if self._is_multiwhite:
-                _type = "Multiwhite"
-                get_lightness_topic = TOPIC_GET_DEVICE_CTL.format(
-                    prefix=self.topic_prefix, device_name=self._device_name
-                )
+            # A status the gateway pushes on its own after the ramp settles
+            # makes the GET redundant; only ask if none arrives in time
+            status_seen = self.coordinator.status_seen
+            status_seen.clear()
+            try:
+                async with asyncio.timeout(_MANUAL_UPDATE_WAIT):
+                    await status_seen.wait()
+            except TimeoutError:
+                pass
             else:
-                _type = "Monochrome"
-                get_lightness_topic = TOPIC_GET_DEVICE_LIGHTNESS.format(
-                    prefix=self.topic_prefix, device_name=self._device_name
+                _LOGGER.debug(
+                    "Status for %s arrived after the command; skipping manual update",
+                    self._device_name,
                 )
+                return
+            _type = "Multiwhite" if self._is_multiwhite else "Monochrome"
             _LOGGER.info(f"requesting manual update for {_type} {self._device_name} with Normal Polling")
-            await self.mqtt_client.async_publish(get_lightness_topic, {}, qos=1)
+            await self.mqtt_client.async_publish(self._get_lightness_topic, EMPTY_PAYLOAD, qos=1)
         else:
             _LOGGER.info(f"requesting manual update for {self._device_name} via RationalPolling")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        power_topic = TOPIC_SET_DEVICE_POWER.format(
-            prefix=self.topic_prefix, device_name=self._device_name
-        )
-
+        before = self._read_state()
         power_command = False
 
-        await self.mqtt_client.async_publish(power_topic, power_command, qos=1)
+        await self.mqtt_client.async_publish(self._power_topic, power_command, qos=1)
 
-        if self.coordinator.data:
-            self.coordinator.data.update({"onoff": 0, "lightness": 0.0})
-        else:
-            self.coordinator.data = {"onoff": 0, "lightness": 0.0}
+        self.coordinator.async_set_optimistic({"onoff": 0, "lightness": 0.0})
 
-        self.async_write_ha_state()
-        await self.async_update_parent_groups()
-        self.coordinator.hass.async_create_task(self.force_manual_update())
+        await self._async_write_if_changed(before)
+        self._schedule_manual_update()
 
 
 class HafeleMeshLightGroup(LightGroup):
@@ -811,13 +1062,20 @@ class HafeleMeshLightGroup(LightGroup):
         self.mqtt_client = mqtt_client
         self.topic_prefix = topic_prefix
         self.tracking_child_ids = child_entity_ids
+        # Membership is fixed for the life of the entity
+        self._child_count = len(child_entity_ids)
+        self._child_id_set = frozenset(child_entity_ids)
 
         self._power_topic = TOPIC_SET_GROUP_POWER.format(prefix=topic_prefix, group_name=group_name)
         self._lightness_topic = TOPIC_SET_GROUP_LIGHTNESS.format(prefix=topic_prefix, group_name=group_name)
         self._ctl_topic = TOPIC_SET_GROUP_CTL.format(prefix=topic_prefix, group_name=group_name)
+        self._temperature_topic = TOPIC_SET_GROUP_TEMPERATURE.format(
+            prefix=topic_prefix, group_name=group_name
+        )
 
         self._last_known_lightness: float = 1.0
         self._last_known_color_temp: int = 2700
+        self._last_written_state: tuple[Any, ...] | None = None
         
         super().__init__(
             unique_id=f"hafele_group_{group_addr}",
@@ -826,10 +1084,72 @@ class HafeleMeshLightGroup(LightGroup):
             mode=False, 
         )
 
+    @property
+    def suggested_object_id(self) -> str | None:
+        """Object id Home Assistant registers on first add, derived from the group name."""
+        return object_id_from_name(self.group_name) or None
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the parent-group index of each child light."""
+        await super().async_added_to_hass()
+        parents = self.hass.data.setdefault(_PARENT_GROUPS, {})
+        # A child listed twice still triggers a single recalculation
+        for entity_id in self._child_id_set:
+            parents.setdefault(entity_id, set()).add(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop this group from the parent-group index."""
+        parents = self.hass.data.get(_PARENT_GROUPS, {})
+        for entity_id in self._child_id_set:
+            groups = parents.get(entity_id)
+            if groups is not None:
+                groups.discard(self)
+                if not groups:
+                    del parents[entity_id]
+        await super().async_will_remove_from_hass()
+
+    def _child_entities(self) -> list[HafeleLightEntity]:
+        """Resolve the loaded Hafele child lights in one pass over the light component."""
+        get_entity = self.hass.data["light"].get_entity
+        return [
+            child_entity
+            for entity_id in self.tracking_child_ids
+            if isinstance(child_entity := get_entity(entity_id), HafeleLightEntity)
+        ]
+
+    def _group_state(self) -> tuple[Any, ...]:
+        """Return everything a state write of this group would publish."""
+        return (
+            getattr(self, "_attr_available", True),
+            self._attr_is_on,
+            self._attr_brightness,
+            getattr(self, "_attr_color_temp_kelvin", None),
+            getattr(self, "_attr_color_mode", None),
+            getattr(self, "_attr_supported_color_modes", None),
+            getattr(self, "_attr_min_color_temp_kelvin", None),
+            getattr(self, "_attr_max_color_temp_kelvin", None),
+            # Replaced by HA on rename/icon changes, which must still be written
+            getattr(self, "registry_entry", None),
+        )
+
     @callback
+    def async_write_ha_state(self) -> None:
+        """Write the group state, skipping writes that would change nothing.
+
+        Our own commands, the parent-group index and LightGroup's child state
+        listener all write through here; every child reports in turn during a
+        group command and most of those reports leave the aggregate as it was.
+        """
+        state = self._group_state()
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        super().async_write_ha_state()
+
     def async_update_group_state_from_children(self) -> None:
-        """Force the group entity to immediately update its state from actual child data."""
-        self.async_update_ha_state(True)
+        """Recompute the group state from its children and write it if it changed."""
+        self.async_update_group_state()
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Send a group action message to the mesh gateway and force direct child state changes."""
@@ -844,75 +1164,95 @@ class HafeleMeshLightGroup(LightGroup):
 
         # Case 1: Brightness was explicitly adjusted via the group
         if ATTR_BRIGHTNESS in kwargs:
-            target_lightness = math.ceil((kwargs[ATTR_BRIGHTNESS] / 255.0) * 100) / 100.0
+            target_lightness = _brightness_to_lightness(kwargs[ATTR_BRIGHTNESS])
             self._last_known_lightness = target_lightness
 
             if ATTR_COLOR_TEMP_KELVIN in kwargs:
                 payload = {"lightness": target_lightness, "temperature": target_color_temp}
                 await self.mqtt_client.async_publish(self._ctl_topic, payload, qos=1)
             else:
-                await self.mqtt_client.async_publish(self._power_topic, True, qos=1)
-                await self.mqtt_client.async_publish(self._lightness_topic, {"lightness": target_lightness}, qos=1)
+                await asyncio.gather(
+                    self.mqtt_client.async_publish(self._power_topic, True, qos=1),
+                    self.mqtt_client.async_publish(
+                        self._lightness_topic, {"lightness": target_lightness}, qos=1
+                    ),
+                )
 
             # Cascade uniform values downward
-            for entity_id in self.tracking_child_ids:
-                child_entity = self.hass.data["light"].get_entity(entity_id)
-                if child_entity and isinstance(child_entity, HafeleLightEntity):
-                    child_entity._last_known_lightness = target_lightness
-                    child_entity._last_known_color_temp = target_color_temp
-                    mock_data = {"onoff": target_onoff, "lightness": target_lightness, "temperature": target_color_temp}
-                    if child_entity.coordinator.data:
-                        child_entity.coordinator.data.update(mock_data)
-                    else:
-                        child_entity.coordinator.data = mock_data
-                    child_entity.async_write_ha_state()
+            for child_entity in self._child_entities():
+                child_entity._last_known_lightness = target_lightness
+                child_entity._last_known_color_temp = target_color_temp
+                child_entity.coordinator.async_set_optimistic(
+                    {
+                        "onoff": target_onoff,
+                        "lightness": target_lightness,
+                        "temperature": target_color_temp,
+                    }
+                )
+                child_entity.async_write_ha_state()
 
         # Case 2: ONLY color temperature was changed. Preserve distinct child brightnesses.
         elif ATTR_COLOR_TEMP_KELVIN in kwargs:
-            for entity_id in self.tracking_child_ids:
-                child_entity = self.hass.data["light"].get_entity(entity_id)
-                if child_entity and isinstance(child_entity, HafeleLightEntity):
-                    current_child_lightness = 1.0
-                    if child_entity.coordinator.data and "lightness" in child_entity.coordinator.data:
-                        current_child_lightness = child_entity.coordinator.data["lightness"]
-                    elif child_entity._last_known_lightness is not None:
-                        current_child_lightness = child_entity._last_known_lightness
-
-                    child_topic_ctl = TOPIC_SET_DEVICE_CTL.format(
-                        prefix=self.topic_prefix, device_name=child_entity.device_name
+            child_lightness: list[tuple[HafeleLightEntity, float]] = []
+            for child_entity in self._child_entities():
+                current_child_lightness = 1.0
+                if child_entity.coordinator.data and "lightness" in child_entity.coordinator.data:
+                    current_child_lightness = child_entity.coordinator.data["lightness"]
+                elif child_entity._last_known_lightness is not None:
+                    current_child_lightness = child_entity._last_known_lightness
+                child_lightness.append((child_entity, current_child_lightness))
+
+            distinct_lightness = {lightness for _child, lightness in child_lightness}
+            if not child_lightness:
+                # No child lightness known; a CTL would have to guess one, so
+                # send the colour temperature alone and leave brightness be
+                await self.mqtt_client.async_publish(
+                    self._temperature_topic, {"temperature": target_color_temp}, qos=1
+                )
+            elif len(child_lightness) == self._child_count and len(distinct_lightness) == 1:
+                # Every child shares one brightness, so one group CTL preserves it
+                payload = {"lightness": distinct_lightness.pop(), "temperature": target_color_temp}
+                await self.mqtt_client.async_publish(self._ctl_topic, payload, qos=1)
+            else:
+                # Children are independent devices; send their CTL commands together
+                await asyncio.gather(
+                    *(
+                        self.mqtt_client.async_publish(
+                            child_entity._ctl_topic,
+                            {"lightness": lightness, "temperature": target_color_temp},
+                            qos=1,
+                        )
+                        for child_entity, lightness in child_lightness
                     )
-                    payload = {"lightness": current_child_lightness, "temperature": target_color_temp}
-                    await self.mqtt_client.async_publish(child_topic_ctl, payload, qos=1)
-
-                    child_entity._last_known_color_temp = target_color_temp
-                    mock_data = {"onoff": target_onoff, "temperature": target_color_temp, "lightness": current_child_lightness}
-                    if child_entity.coordinator.data:
-                        child_entity.coordinator.data.update(mock_data)
-                    else:
-                        child_entity.coordinator.data = mock_data
-                    child_entity.async_write_ha_state()
+                )
+
+            for child_entity, current_child_lightness in child_lightness:
+                child_entity._last_known_color_temp = target_color_temp
+                child_entity.coordinator.async_set_optimistic(
+                    {
+                        "onoff": target_onoff,
+                        "temperature": target_color_temp,
+                        "lightness": current_child_lightness,
+                    }
+                )
+                child_entity.async_write_ha_state()
         
         # Case 3: Simple Turn On command with no arguments
         else:
             await self.mqtt_client.async_publish(self._power_topic, True, qos=1)
             
             # Cascade "ON" state down to children using their existing individual brightness values
-            for entity_id in self.tracking_child_ids:
-                child_entity = self.hass.data["light"].get_entity(entity_id)
-                if child_entity and isinstance(child_entity, HafeleLightEntity):
-                    current_child_lightness = 1.0
-                    if child_entity._last_known_lightness is not None:
-                        current_child_lightness = child_entity._last_known_lightness
-                    elif child_entity.coordinator.data and "lightness" in child_entity.coordinator.data:
-                        current_child_lightness = child_entity.coordinator.data["lightness"]
-
-                    mock_data = {"onoff": 1, "lightness": current_child_lightness}
-                    if child_entity.coordinator.data:
-                        child_entity.coordinator.data.update(mock_data)
-                    else:
-                        child_entity.coordinator.data = mock_data
-                    
-                    child_entity.async_write_ha_state()
+            for child_entity in self._child_entities():
+                current_child_lightness = 1.0
+                if child_entity._last_known_lightness is not None:
+                    current_child_lightness = child_entity._last_known_lightness
+                elif child_entity.coordinator.data and "lightness" in child_entity.coordinator.data:
+                    current_child_lightness = child_entity.coordinator.data["lightness"]
+
+                child_entity.coordinator.async_set_optimistic(
+                    {"onoff": 1, "lightness": current_child_lightness}
+                )
+                child_entity.async_write_ha_state()
 
         self._attr_is_on = True
         if ATTR_BRIGHTNESS in kwargs:
@@ -925,15 +1265,9 @@ class HafeleMeshLightGroup(LightGroup):
         await self.mqtt_client.async_publish(self._power_topic, False, qos=1)
         
         # CASCADE DOWNWARD
-        for entity_id in self.tracking_child_ids:
-            child_entity = self.hass.data["light"].get_entity(entity_id)
-            if child_entity and isinstance(child_entity, HafeleLightEntity):
-                mock_data = {"onoff": 0, "lightness": 0.0}
-                if child_entity.coordinator.data:
-                    child_entity.coordinator.data.update(mock_data)
-                else:
-                    child_entity.coordinator.data = mock_data
-                child_entity.async_write_ha_state()
+        for child_entity in self._child_entities():
+            child_entity.coordinator.async_set_optimistic({"onoff": 0, "lightness": 0.0})
+            child_entity.async_write_ha_state()
 
         self._attr_is_on = False
         self.async_write_ha_state()
@@ -2,15 +2,27 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
+from functools import lru_cache
 import json
 import logging
 from typing import Any, Callable
 
 from homeassistant.components import mqtt
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback as ha_callback
 
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    # orjson ships with Home Assistant; it parses bytes directly in C
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Pre-serialized empty JSON object for GET requests; strings are published
+# as-is, so this skips a dict allocation and json.dumps per request
+EMPTY_PAYLOAD = "{}"
+
 try:
     from aiomqtt import Client as MQTTClient
     from aiomqtt.exceptions import MqttError
@@ -21,6 +33,99 @@ except ImportError:
     _LOGGER.warning("aiomqtt not available, direct MQTT connections disabled")
 
 
+@lru_cache(maxsize=4096)
+def _split_topic(topic: str) -> tuple[str, ...]:
+    """Split a topic into its levels; status topics recur every poll."""
+    return tuple(topic.split("/"))
+
+
+class _TopicNode:
+    """One topic level in a HafeleTopicRouter trie."""
+
+    __slots__ = ("children", "callback")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.callback: Callable[[str, Any], None] | None = None
+
+
+class HafeleTopicRouter:
+    """Route topics to callbacks through a trie of topic levels.
+
+    Patterns may use the MQTT ``+`` (single level) and ``#`` (remaining
+    levels) wildcards. Routing cost depends on topic depth, not on the
+    number of registered patterns.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty router."""
+        self._root = _TopicNode()
+
+    def add(self, pattern: str, callback: Callable[[str, Any], None]) -> None:
+        """Register (or replace) the callback for a topic pattern."""
+        node = self._root
+        for level in _split_topic(pattern):
+            node = node.children.setdefault(level, _TopicNode())
+        node.callback = callback
+
+    def remove(self, pattern: str) -> None:
+        """Remove the callback for a topic pattern, pruning empty levels."""
+        path = [self._root]
+        levels = _split_topic(pattern)
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].callback = None
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.callback is not None or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+
+    def route(self, topic: str) -> list[Callable[[str, Any], None]]:
+        """Return the callbacks of every pattern matching a topic."""
+        matches: list[Callable[[str, Any], None]] = []
+        nodes = [self._root]
+        for level in _split_topic(topic):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if (wild := children.get("#")) is not None and wild.callback:
+                    matches.append(wild.callback)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if (plus := children.get("+")) is not None:
+                    next_nodes.append(plus)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+        for node in nodes:
+            if node.callback is not None:
+                matches.append(node.callback)
+            # "a/#" also matches the parent level "a"
+            if (wild := node.children.get("#")) is not None and wild.callback:
+                matches.append(wild.callback)
+        return matches
+
+
+async def async_call_unsubscribers(unsubscribers: Iterable[Callable[[], Any]]) -> None:
+    """Call every unsubscriber, awaiting the async ones concurrently.
+
+    Direct-connection unsubscribers each send an UNSUBSCRIBE and wait for
+    the broker; gathering them costs one round trip instead of one each.
+    Whether an unsubscriber is async is read off what it returns rather than
+    by introspecting the callable.
+    """
+    pending = []
+    for unsub in unsubscribers:
+        if callable(unsub) and asyncio.iscoroutine(result := unsub()):
+            pending.append(result)
+    if pending:
+        await asyncio.gather(*pending)
+
+
 class HafeleMQTTClient:
     """MQTT client for Hafele Local MQTT devices."""
 
@@ -37,6 +142,8 @@ class HafeleMQTTClient:
         self.hass = hass
         self.topic_prefix = topic_prefix
         self._subscriptions: dict[str, Callable] = {}
+        # Dispatch table for the direct connection's message listener
+        self._router = HafeleTopicRouter()
         self._use_ha_mqtt = broker is None
         self._broker = broker
         self._port = port
@@ -115,20 +222,25 @@ class HafeleMQTTClient:
         _LOGGER.debug("Subscribing to topic: %s", topic)
 
         if self._use_ha_mqtt:
-            # Use Home Assistant's MQTT integration
-            async def message_received(msg: mqtt.ReceiveMessage) -> None:
+            # Use Home Assistant's MQTT integration. Handlers only decode and
+            # update in-memory state, so run them inline on the event loop
+            # rather than letting HA schedule a task for every message.
+            @ha_callback
+            def message_received(msg: mqtt.ReceiveMessage) -> None:
                 """Handle received MQTT message."""
                 try:
                     payload = msg.payload
                     # Try to parse as JSON, fallback to string
                     try:
-                        data = json.loads(payload)
-                    except (json.JSONDecodeError, TypeError):
+                        data = json_loads(payload)
+                    except (ValueError, TypeError):
                         data = payload.decode("utf-8") if isinstance(payload, bytes) else payload
 
-                    callback(topic, data)
+                    # Hand over the message's own topic, not the subscribed
+                    # pattern, so wildcard subscribers can tell sources apart
+                    callback(msg.topic, data)
                 except Exception as err:
-                    _LOGGER.error("Error processing MQTT message on %s: %s", topic, err)
+                    _LOGGER.error("Error processing MQTT message on %s: %s", msg.topic, err)
 
             unsubscribe = await mqtt.async_subscribe(
                 self.hass, topic, message_received, qos=qos
@@ -141,16 +253,54 @@ class HafeleMQTTClient:
                 raise ConnectionError("MQTT client not connected")
 
             await self._mqtt_client.subscribe(topic, qos=qos)
-            self._subscriptions[topic] = callback
+            return self._register_direct(topic, callback)
 
-            # Return unsubscribe function
-            async def unsubscribe():
-                if topic in self._subscriptions:
-                    await self._mqtt_client.unsubscribe(topic)
-                    del self._subscriptions[topic]
+    async def async_subscribe_many(
+        self, subscriptions: list[tuple[str, Callable[[str, Any], None]]], qos: int = 0
+    ) -> list[Callable[[], None]]:
+        """Subscribe to several topics at once, returning unsubscribers in order."""
+        if not subscriptions:
+            return []
+        if self._use_ha_mqtt:
+            # HA's MQTT client already coalesces concurrent subscribes into
+            # batched SUBSCRIBE packets
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.async_subscribe(topic, callback, qos=qos)
+                        for topic, callback in subscriptions
+                    )
+                )
+            )
 
-            self._unsubscribers[topic] = unsubscribe
-            return unsubscribe
+        if not self._mqtt_client or not self._connected:
+            raise ConnectionError("MQTT client not connected")
+
+        _LOGGER.debug("Subscribing to %d topics", len(subscriptions))
+        # One SUBSCRIBE packet for every topic
+        await self._mqtt_client.subscribe(
+            [(topic, qos) for topic, _callback in subscriptions]
+        )
+        return [
+            self._register_direct(topic, callback) for topic, callback in subscriptions
+        ]
+
+    def _register_direct(
+        self, topic: str, callback: Callable[[str, Any], None]
+    ) -> Callable[[], Any]:
+        """Record a direct-connection subscription and build its unsubscriber."""
+        self._subscriptions[topic] = callback
+        self._router.add(topic, callback)
+
+        # Return unsubscribe function
+        async def unsubscribe():
+            if topic in self._subscriptions:
+                await self._mqtt_client.unsubscribe(topic)
+                del self._subscriptions[topic]
+                self._router.remove(topic)
+
+        self._unsubscribers[topic] = unsubscribe
+        return unsubscribe
 
     async def async_unsubscribe(self, topic: str) -> None:
         """Unsubscribe from an MQTT topic."""
@@ -189,14 +339,13 @@ class HafeleMQTTClient:
         try:
             async for msg in self._mqtt_client.messages:
                 topic = msg.topic.value
-                if topic in self._subscriptions:
-                    callback = self._subscriptions[topic]
+                for callback in self._router.route(topic):
                     try:
                         payload = msg.payload
                         # Try to parse as JSON, fallback to string
                         try:
-                            data = json.loads(payload)
-                        except (json.JSONDecodeError, TypeError):
+                            data = json_loads(payload)
+                        except (ValueError, TypeError):
                             data = payload.decode("utf-8") if isinstance(payload, bytes) else payload
                         
                         # Call the callback directly (it's synchronous)
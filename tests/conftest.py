@@ -12,7 +12,7 @@ import pytest
 from custom_components.hafele_local_mqtt.const import DOMAIN
 
 
-def schedule_ha_task(coro: Any) -> Any:
+def schedule_ha_task(coro: Any, **kwargs: Any) -> Any:
     """Mock Home Assistant ``async_create_task``: schedule or finish coroutines cleanly."""
     if not asyncio.iscoroutine(coro):
         return MagicMock(name="ha_task")
@@ -46,6 +46,7 @@ def mock_hass():
     hass.bus.async_listen_once = MagicMock(return_value=MagicMock())
     hass.async_create_task = MagicMock(side_effect=schedule_ha_task)
     hass.async_block_till_done = AsyncMock()
+    hass.loop = MagicMock()
     hass.config_entries = MagicMock()
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
@@ -59,6 +60,9 @@ def mock_mqtt_client():
     client.async_connect = AsyncMock()
     client.async_disconnect = AsyncMock()
     client.async_subscribe = AsyncMock(return_value=AsyncMock())
+    client.async_subscribe_many = AsyncMock(
+        side_effect=lambda subscriptions, qos=0: [AsyncMock() for _ in subscriptions]
+    )
     client.async_publish = AsyncMock()
     client.async_unsubscribe = AsyncMock()
     client.topic_prefix = "hafele"
@@ -73,6 +77,8 @@ def mock_discovery():
     discovery.get_device = MagicMock(return_value=None)
     discovery.get_all_groups = MagicMock(return_value={})
     discovery.get_all_scenes = MagicMock(return_value={})
+    discovery.iter_devices = MagicMock(side_effect=lambda: discovery.get_all_devices().items())
+    discovery.iter_groups = MagicMock(side_effect=lambda: discovery.get_all_groups().items())
     discovery.async_start = AsyncMock()
     discovery.async_stop = AsyncMock()
     return discovery
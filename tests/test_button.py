@@ -113,3 +113,102 @@ def test_ping_button_entity_registry_enabled_default_false(mock_mqtt_client):
         "123_ping_lightness",
     )
     assert button.entity_registry_enabled_default is False
+
+
+@pytest.mark.asyncio
+async def test_button_unknown_type_does_not_publish(mock_mqtt_client):
+    """Unknown button types have no ping topic and publish nothing."""
+    device_info = {
+        "device_name": "Test Light",
+        "device_addr": 123,
+        "device_types": ["Light"],
+    }
+    button = HafelePingButton(
+        mock_mqtt_client,
+        123,
+        device_info,
+        "Test Light",
+        "hafele",
+        "color",
+        "Ping color",
+        "123_ping_color",
+    )
+
+    await button.async_press()
+
+    assert button._ping_topic is None
+    mock_mqtt_client.async_publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_button_setup_registers_suggested_ids_and_adds_once(
+    mock_hass, mock_config_entry, mock_mqtt_client, mock_discovery, mock_entity_registry
+):
+    """Platform setup registers each ping button and adds them in one batch."""
+    from unittest.mock import patch
+
+    from custom_components.hafele_local_mqtt.button import async_setup_entry
+    from custom_components.hafele_local_mqtt.const import DOMAIN
+
+    mock_discovery.get_all_devices.return_value = {
+        123: {"device_name": "Kitchen Spot-1", "device_types": ["Light"]},
+        456: {"device_name": "Wall Switch", "device_types": ["Switch"]},
+    }
+    mock_hass.data[DOMAIN][mock_config_entry.entry_id] = {
+        "mqtt_client": mock_mqtt_client,
+        "discovery": mock_discovery,
+        "topic_prefix": "hafele",
+    }
+    async_add_entities = MagicMock()
+
+    with patch(
+        "custom_components.hafele_local_mqtt.button.er.async_get",
+        return_value=mock_entity_registry,
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry, async_add_entities)
+
+    async_add_entities.assert_called_once()
+    entities = async_add_entities.call_args[0][0]
+    assert [e._attr_unique_id for e in entities] == ["123_ping_lightness", "123_ping_power"]
+    suggested = [
+        call.kwargs["suggested_object_id"]
+        for call in mock_entity_registry.async_get_or_create.call_args_list
+    ]
+    assert suggested == ["kitchen_spot_1_lightness_ping", "kitchen_spot_1_power_ping"]
+
+
+@pytest.mark.asyncio
+async def test_button_setup_skips_registering_known_buttons(
+    mock_hass, mock_config_entry, mock_mqtt_client, mock_discovery, mock_entity_registry
+):
+    """Buttons already in the entity registry are added without re-registering."""
+    from unittest.mock import patch
+
+    from custom_components.hafele_local_mqtt.button import async_setup_entry
+    from custom_components.hafele_local_mqtt.const import DOMAIN
+
+    mock_discovery.get_all_devices.return_value = {
+        123: {"device_name": "Kitchen Spot-1", "device_types": ["Light"]},
+    }
+    mock_hass.data[DOMAIN][mock_config_entry.entry_id] = {
+        "mqtt_client": mock_mqtt_client,
+        "discovery": mock_discovery,
+        "topic_prefix": "hafele",
+    }
+    registered = [
+        MagicMock(unique_id=f"123_ping_{kind}", entity_id=f"button.kitchen_spot_1_{kind}_ping", domain="button")
+        for kind in ("lightness", "power")
+    ]
+    async_add_entities = MagicMock()
+
+    with patch(
+        "custom_components.hafele_local_mqtt.button.er.async_get",
+        return_value=mock_entity_registry,
+    ), patch(
+        "custom_components.hafele_local_mqtt.button.er.async_entries_for_config_entry",
+        return_value=registered,
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry, async_add_entities)
+
+    assert len(async_add_entities.call_args[0][0]) == 2
+    mock_entity_registry.async_get_or_create.assert_not_called()
@@ -6,3 +6,33 @@ def test_group_ctl_topic_template():
     """Group CTL topic follows gateway prefix and group name."""
     topic = TOPIC_SET_GROUP_CTL.format(prefix="Mesh", group_name="Living Room")
     assert topic == "Mesh/groups/Living Room/ctl"
+
+
+def test_const_all_is_complete():
+    """``__all__`` lists every public constant exactly once and nothing stale."""
+    from custom_components.hafele_local_mqtt import const
+
+    public = {
+        name
+        for name, value in vars(const).items()
+        if not name.startswith("_") and getattr(value, "__module__", const.__name__) == const.__name__
+    }
+    assert len(const.__all__) == len(set(const.__all__))
+    assert set(const.__all__) == public
+    assert const.DEFAULT_POLLING_INTERVAL == 30
+
+
+def test_object_id_table_sanitizes_in_one_pass():
+    """Names lowercase, spaces/hyphens become underscores, other characters drop."""
+    from custom_components.hafele_local_mqtt.const import OBJECT_ID_TABLE
+
+    assert "Küche-Licht 2".translate(OBJECT_ID_TABLE) == "kche_licht_2"
+    assert "Desk (left)!".translate(OBJECT_ID_TABLE) == "desk_left"
+
+
+def test_object_id_from_name_strips_edge_underscores():
+    """The shared helper sanitizes and trims names for both platforms."""
+    from custom_components.hafele_local_mqtt.const import object_id_from_name
+
+    assert object_id_from_name(" Desk Lamp-") == "desk_lamp"
+    assert object_id_from_name("!!!") == ""
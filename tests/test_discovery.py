@@ -12,6 +12,12 @@ from custom_components.hafele_local_mqtt.const import (
 )
 
 
+def _flush_fire(mock_hass):
+    """Run the debounced devices-updated callback scheduled on the loop."""
+    _delay, fire = mock_hass.loop.call_later.call_args[0]
+    fire()
+
+
 @pytest.mark.asyncio
 async def test_discovery_start(mock_hass, mock_mqtt_client):
     """Test discovery start."""
@@ -19,8 +25,14 @@ async def test_discovery_start(mock_hass, mock_mqtt_client):
     
     await discovery.async_start()
     
-    # Verify subscriptions
-    assert mock_mqtt_client.async_subscribe.call_count == 3
+    # Verify all three discovery topics were subscribed in one batch
+    mock_mqtt_client.async_subscribe_many.assert_awaited_once()
+    subscriptions = mock_mqtt_client.async_subscribe_many.call_args[0][0]
+    assert [topic for topic, _cb in subscriptions] == [
+        "hafele/lights",
+        "hafele/groups",
+        "hafele/scenes",
+    ]
     assert len(discovery._unsubscribers) == 3
 
 
@@ -45,7 +57,7 @@ def test_on_lights_message(mock_hass, mock_mqtt_client):
         {"device_addr": 456, "device_name": "Light 2", "device_types": ["Light"]},
     ]
     
-    discovery._on_lights_message("hafele/lights", lights_data)
+    discovery._on_discovery("lights", "hafele/lights", lights_data)
     
     # Verify devices were added
     assert len(discovery.devices) == 2
@@ -53,8 +65,34 @@ def test_on_lights_message(mock_hass, mock_mqtt_client):
     assert 456 in discovery.devices
     assert discovery.devices[123]["device_name"] == "Light 1"
     
-    # Verify event was fired
-    mock_hass.bus.async_fire.assert_called_once_with(EVENT_DEVICES_UPDATED)
+    # Verify event was fired with the newly discovered addresses
+    mock_hass.bus.async_fire.assert_not_called()
+    _flush_fire(mock_hass)
+    mock_hass.bus.async_fire.assert_called_once_with(
+        EVENT_DEVICES_UPDATED, {"new_addrs": [123, 456], "new_group_addrs": []}
+    )
+
+
+def test_on_lights_message_reports_only_new_addrs(mock_hass, mock_mqtt_client):
+    """Republished lights are not reported as new."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+    discovery._on_discovery("lights", "hafele/lights", [{"device_addr": 123, "device_name": "Light 1"}])
+    _flush_fire(mock_hass)
+    mock_hass.bus.async_fire.reset_mock()
+
+    discovery._on_discovery(
+        "lights",
+        "hafele/lights",
+        [
+            {"device_addr": 123, "device_name": "Light 1"},
+            {"device_addr": 789, "device_name": "Light 3"},
+        ],
+    )
+    _flush_fire(mock_hass)
+
+    mock_hass.bus.async_fire.assert_called_once_with(
+        EVENT_DEVICES_UPDATED, {"new_addrs": [789], "new_group_addrs": []}
+    )
 
 
 def test_on_lights_message_string_payload(mock_hass, mock_mqtt_client):
@@ -66,7 +104,7 @@ def test_on_lights_message_string_payload(mock_hass, mock_mqtt_client):
     ]
     payload = json.dumps(lights_data)
     
-    discovery._on_lights_message("hafele/lights", payload)
+    discovery._on_discovery("lights", "hafele/lights", payload)
     
     assert len(discovery.devices) == 1
     assert 123 in discovery.devices
@@ -77,12 +115,29 @@ def test_on_lights_message_invalid_format(mock_hass, mock_mqtt_client):
     discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
     
     # Invalid format (not a list)
-    discovery._on_lights_message("hafele/lights", {"invalid": "data"})
+    discovery._on_discovery("lights", "hafele/lights", {"invalid": "data"})
     
     # Should not add devices
     assert len(discovery.devices) == 0
 
 
+def test_on_lights_message_skips_malformed_records(mock_hass, mock_mqtt_client):
+    """A bad record is logged and skipped; the rest of the list still lands."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+
+    discovery._on_discovery(
+        "lights",
+        "hafele/lights",
+        [
+            {"device_addr": [1], "device_name": "Unhashable"},
+            "not a record",
+            {"device_addr": 2, "device_name": "Desk"},
+        ],
+    )
+
+    assert list(discovery.devices) == [2]
+
+
 def test_on_groups_message(mock_hass, mock_mqtt_client):
     """Test groups discovery message handling."""
     discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
@@ -92,7 +147,7 @@ def test_on_groups_message(mock_hass, mock_mqtt_client):
         {"group_main_addr": 2, "group_name": "Group 2"},
     ]
     
-    discovery._on_groups_message("hafele/groups", groups_data)
+    discovery._on_discovery("groups", "hafele/groups", groups_data)
     
     assert len(discovery.groups) == 2
     assert 1 in discovery.groups
@@ -108,7 +163,7 @@ def test_on_scenes_message(mock_hass, mock_mqtt_client):
         {"scene_id": 2, "scene_name": "Scene 2"},
     ]
     
-    discovery._on_scenes_message("hafele/scenes", scenes_data)
+    discovery._on_discovery("scenes", "hafele/scenes", scenes_data)
     
     assert len(discovery.scenes) == 2
     assert 1 in discovery.scenes
@@ -136,5 +191,102 @@ def test_get_all_devices(mock_hass, mock_mqtt_client):
     
     all_devices = discovery.get_all_devices()
     assert len(all_devices) == 2
-    # Should return a copy
+    # Should return a read-only view, not the backing dict
     assert all_devices is not discovery.devices
+    with pytest.raises(TypeError):
+        all_devices[789] = {"device_name": "Light 3"}
+
+    # The view tracks later discoveries without being fetched again
+    discovery.devices[789] = {"device_name": "Light 3"}
+    assert 789 in all_devices
+
+
+def test_discovery_interns_recurring_names(mock_hass, mock_mqtt_client):
+    """Names from separate payloads share one interned string object."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+    first = json.loads('[{"device_addr": 1, "device_name": "Kitchen Strip"}]')
+    second = json.loads('[{"device_addr": 1, "device_name": "Kitchen Strip"}]')
+
+    discovery._on_discovery("lights", "hafele/lights", first)
+    name_first = discovery.devices[1]["device_name"]
+    discovery._on_discovery("lights", "hafele/lights", second)
+
+    assert discovery.devices[1]["device_name"] is name_first
+
+
+def test_discovery_burst_fires_one_event(mock_hass, mock_mqtt_client):
+    """Back-to-back discovery payloads collapse into a single event."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+
+    discovery._on_discovery("lights", "hafele/lights", [{"device_addr": 1, "device_name": "A"}])
+    discovery._on_discovery("groups", "hafele/groups", [{"group_main_addr": 9, "group_name": "G"}])
+    discovery._on_discovery("lights", "hafele/lights", [{"device_addr": 2, "device_name": "B"}])
+
+    assert mock_hass.loop.call_later.call_count == 1
+    _flush_fire(mock_hass)
+    mock_hass.bus.async_fire.assert_called_once_with(
+        EVENT_DEVICES_UPDATED, {"new_addrs": [1, 2], "new_group_addrs": [9]}
+    )
+
+
+def test_unchanged_announcement_does_not_fire(mock_hass, mock_mqtt_client):
+    """Re-announcing identical lights and groups leaves state and listeners alone."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+    lights = [{"device_addr": 1, "device_name": "A", "device_types": ["light"]}]
+    groups = [{"group_main_addr": 9, "group_name": "G", "devices": [1]}]
+    discovery._on_discovery("lights", "hafele/lights", lights)
+    discovery._on_discovery("groups", "hafele/groups", groups)
+    _flush_fire(mock_hass)
+    stored = discovery.devices[1]
+    mock_hass.loop.call_later.reset_mock()
+
+    discovery._on_discovery("lights", "hafele/lights", json.loads(json.dumps(lights)))
+    discovery._on_discovery("groups", "hafele/groups", json.loads(json.dumps(groups)))
+
+    mock_hass.loop.call_later.assert_not_called()
+    assert discovery.devices[1] is stored
+
+
+def test_discovery_has_no_instance_dict(mock_hass, mock_mqtt_client):
+    """Discovery state lives in slots; stray attributes are rejected."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+
+    assert not hasattr(discovery, "__dict__")
+    with pytest.raises(AttributeError):
+        discovery.unexpected = True
+
+
+def test_on_lights_message_bytes_payload(mock_hass, mock_mqtt_client):
+    """Raw JSON bytes are decoded like text payloads."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+
+    discovery._on_discovery("lights", "hafele/lights", b'[{"device_addr": 5, "device_name": "Hall"}]')
+
+    assert discovery.devices[5]["device_name"] == "Hall"
+
+
+@pytest.mark.asyncio
+async def test_discovery_subscriptions_dispatch_by_kind(mock_hass, mock_mqtt_client):
+    """Each subscribed callback stores into its own kind; scenes don't notify."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+    await discovery.async_start()
+    callbacks = dict(mock_mqtt_client.async_subscribe_many.call_args[0][0])
+
+    callbacks["hafele/scenes"]("hafele/scenes", [{"scene_id": 3, "scene_name": "Evening"}])
+    callbacks["hafele/groups"]("hafele/groups", [{"group_main_addr": 7, "group_name": "Hall"}])
+
+    assert 3 in discovery.scenes
+    assert 7 in discovery.groups
+    assert discovery.devices == {}
+    assert mock_hass.loop.call_later.call_count == 1
+
+
+def test_iter_devices_and_groups(mock_hass, mock_mqtt_client):
+    """The iterators yield stored records directly."""
+    discovery = HafeleDiscovery(mock_hass, mock_mqtt_client, "hafele")
+    discovery.devices[1] = {"device_name": "A"}
+    discovery.groups[9] = {"group_name": "G"}
+
+    assert list(discovery.iter_devices()) == [(1, {"device_name": "A"})]
+    assert list(discovery.iter_groups()) == [(9, {"group_name": "G"})]
+    assert next(iter(discovery.iter_devices()))[1] is discovery.devices[1]
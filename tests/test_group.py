@@ -1,8 +1,12 @@
 """Tests for HafeleMeshLightGroup (PR #18 group control via MQTT)."""
 from __future__ import annotations
 
+from functools import partial
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.components.group.light import LightGroup
 
 from tests.conftest import schedule_ha_task
 
@@ -15,6 +19,7 @@ from custom_components.hafele_local_mqtt.const import (
     TOPIC_SET_GROUP_CTL,
     TOPIC_SET_GROUP_LIGHTNESS,
     TOPIC_SET_GROUP_POWER,
+    TOPIC_SET_GROUP_TEMPERATURE,
 )
 
 
@@ -23,6 +28,7 @@ def mock_coordinator():
     """Mock light coordinator for child cascade tests."""
     coordinator = MagicMock(spec=HafeleLightCoordinator)
     coordinator.data = {}
+    coordinator.async_set_optimistic = partial(HafeleLightCoordinator.async_set_optimistic, coordinator)
     coordinator.hass = MagicMock()
     coordinator.hass.async_create_task = MagicMock(side_effect=schedule_ha_task)
     return coordinator
@@ -101,11 +107,14 @@ async def test_mesh_group_turn_on_ctl_path(mesh_group, mock_mqtt_client):
 
 @pytest.mark.asyncio
 async def test_mesh_group_turn_on_clamps_color_temp(mesh_group, mock_mqtt_client):
-    """Color temperature is clamped to the supported kelvin range."""
+    """Color temperature is clamped; with no child lightness only temperature is sent."""
     await mesh_group.async_turn_on(color_temp_kelvin=6000)
 
-    payload = mock_mqtt_client.async_publish.await_args.args[1]
-    assert payload["temperature"] == 5000
+    mock_mqtt_client.async_publish.assert_awaited_once_with(
+        TOPIC_SET_GROUP_TEMPERATURE.format(prefix="Mesh", group_name="Kitchen"),
+        {"temperature": 5000},
+        qos=1,
+    )
 
 
 @pytest.mark.asyncio
@@ -131,6 +140,38 @@ async def test_mesh_group_turn_on_cascades_to_children(
     child.async_write_ha_state.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_mesh_group_color_temp_only_collapses_uniform_children(
+    mesh_group, mock_mqtt_client, mock_coordinator, sample_device_info
+):
+    """Children sharing one brightness get a single group CTL; mixed ones get their own."""
+    children = {}
+    for addr, entity_id in ((1, "light.kitchen_1"), (2, "light.kitchen_2")):
+        coordinator = MagicMock(spec=HafeleLightCoordinator)
+        coordinator.data = {"lightness": 0.4}
+        coordinator.async_set_optimistic = partial(HafeleLightCoordinator.async_set_optimistic, coordinator)
+        coordinator.hass = mock_coordinator.hass
+        child = HafeleLightEntity(coordinator, addr, dict(sample_device_info, device_name=f"K{addr}"), mock_mqtt_client, "Mesh")
+        child.async_write_ha_state = MagicMock()
+        children[entity_id] = child
+    mesh_group.hass.data["light"].get_entity = children.get
+
+    await mesh_group.async_turn_on(color_temp_kelvin=3000)
+
+    mock_mqtt_client.async_publish.assert_awaited_once_with(
+        TOPIC_SET_GROUP_CTL.format(prefix="Mesh", group_name="Kitchen"),
+        {"lightness": 0.4, "temperature": 3000},
+        qos=1,
+    )
+
+    mock_mqtt_client.async_publish.reset_mock()
+    children["light.kitchen_2"].coordinator.data["lightness"] = 0.8
+    await mesh_group.async_turn_on(color_temp_kelvin=3500)
+
+    topics = {call.args[0] for call in mock_mqtt_client.async_publish.await_args_list}
+    assert topics == {"Mesh/lights/K1/ctl", "Mesh/lights/K2/ctl"}
+
+
 @pytest.mark.asyncio
 async def test_mesh_group_turn_off(mesh_group, mock_mqtt_client):
     """turn_off sends group power false."""
@@ -165,7 +206,71 @@ async def test_mesh_group_turn_off_cascades_to_children(
 
 
 def test_mesh_group_async_update_group_state_from_children(mesh_group):
-    """Parent group refresh is triggered from child state updates."""
-    mesh_group.async_update_ha_state = MagicMock()
-    mesh_group.async_update_group_state_from_children()
-    mesh_group.async_update_ha_state.assert_called_once_with(True)
+    """Child updates recompute the group and write state only when it changes."""
+    brightness = iter([128, 128, 255])
+
+    def recompute():
+        mesh_group._attr_is_on = True
+        mesh_group._attr_brightness = next(brightness)
+
+    mesh_group.async_update_group_state = MagicMock(side_effect=recompute)
+
+    with patch.object(LightGroup, "async_write_ha_state") as base_write:
+        mesh_group.async_update_group_state_from_children()
+        mesh_group.async_update_group_state_from_children()
+        assert base_write.call_count == 1
+
+        mesh_group.async_update_group_state_from_children()
+        assert base_write.call_count == 2
+
+
+def test_mesh_group_direct_writes_share_the_dedup(mesh_group):
+    """LightGroup's own listener writes directly; those are deduplicated too."""
+    mesh_group._attr_is_on = True
+    mesh_group._attr_brightness = 255
+
+    with patch.object(LightGroup, "async_write_ha_state") as base_write:
+        mesh_group.async_write_ha_state()
+        mesh_group.async_write_ha_state()
+        assert base_write.call_count == 1
+
+        # A colour mode change alone is still written
+        mesh_group._attr_color_mode = "color_temp"
+        mesh_group.async_write_ha_state()
+        assert base_write.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_mesh_group_own_command_refreshes_dedup(mesh_group):
+    """After the group's own turn_off, a child update back to on is written."""
+
+    def recompute():
+        mesh_group._attr_is_on = True
+        mesh_group._attr_brightness = 255
+
+    mesh_group.async_update_group_state = MagicMock(side_effect=recompute)
+
+    with patch.object(LightGroup, "async_write_ha_state") as base_write:
+        mesh_group.async_update_group_state_from_children()
+        await mesh_group.async_turn_off()
+        mesh_group.async_update_group_state_from_children()
+
+    assert base_write.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_mesh_group_indexes_duplicate_child_once(mock_mqtt_client):
+    """A child listed twice registers the group once in the parent index."""
+    from custom_components.hafele_local_mqtt.light import _PARENT_GROUPS
+
+    group = HafeleMeshLightGroup(
+        10, "Kitchen", ["light.kitchen_1", "light.kitchen_1"], mock_mqtt_client, "Mesh"
+    )
+    group.hass = MagicMock()
+    group.hass.data = {}
+
+    await group.async_added_to_hass()
+    assert group.hass.data[_PARENT_GROUPS] == {"light.kitchen_1": {group}}
+
+    await group.async_will_remove_from_hass()
+    assert group.hass.data[_PARENT_GROUPS] == {}
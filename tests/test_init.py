@@ -9,6 +9,10 @@ from custom_components.hafele_local_mqtt.const import (
     CONF_MQTT_PORT,
     CONF_MQTT_USERNAME,
     CONF_USE_HA_MQTT,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_POLLING_TIMEOUT,
+    DEFAULT_TOPIC_PREFIX,
     DOMAIN,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -18,9 +22,9 @@ from homeassistant.config_entries import ConfigEntry
 async def test_setup_entry(mock_hass, mock_config_entry):
     """Test integration setup."""
     with patch(
-        "custom_components.hafele_local_mqtt.HafeleMQTTClient"
+        "custom_components.hafele_local_mqtt.mqtt_client.HafeleMQTTClient"
     ) as mock_mqtt_class, patch(
-        "custom_components.hafele_local_mqtt.HafeleDiscovery"
+        "custom_components.hafele_local_mqtt.discovery.HafeleDiscovery"
     ) as mock_discovery_class:
         
         mock_mqtt = mock_mqtt_class.return_value
@@ -56,9 +60,9 @@ async def test_setup_entry_uses_direct_broker_when_mqtt_broker_configured(mock_h
     entry.async_on_unload = MagicMock()
 
     with patch(
-        "custom_components.hafele_local_mqtt.HafeleMQTTClient"
+        "custom_components.hafele_local_mqtt.mqtt_client.HafeleMQTTClient"
     ) as mock_mqtt_class, patch(
-        "custom_components.hafele_local_mqtt.HafeleDiscovery"
+        "custom_components.hafele_local_mqtt.discovery.HafeleDiscovery"
     ) as mock_discovery_class:
         mock_mqtt_class.return_value.async_connect = AsyncMock()
         mock_discovery_class.return_value.async_start = AsyncMock()
@@ -76,6 +80,39 @@ async def test_setup_entry_uses_direct_broker_when_mqtt_broker_configured(mock_h
     )
 
 
+@pytest.mark.asyncio
+async def test_setup_entry_fills_defaults_for_missing_options(mock_hass):
+    """Options missing from older entries fall back to integration defaults."""
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "legacy_entry"
+    entry.data = {CONF_USE_HA_MQTT: True}
+    entry.async_on_unload = MagicMock()
+
+    with patch(
+        "custom_components.hafele_local_mqtt.mqtt_client.HafeleMQTTClient"
+    ) as mock_mqtt_class, patch(
+        "custom_components.hafele_local_mqtt.discovery.HafeleDiscovery"
+    ) as mock_discovery_class:
+        mock_mqtt_class.return_value.async_connect = AsyncMock()
+        mock_discovery_class.return_value.async_start = AsyncMock()
+
+        await async_setup_entry(mock_hass, entry)
+
+    stored = mock_hass.data[DOMAIN]["legacy_entry"]
+    assert stored["topic_prefix"] == DEFAULT_TOPIC_PREFIX
+    assert stored["polling_interval"] == DEFAULT_POLLING_INTERVAL
+    assert stored["polling_timeout"] == DEFAULT_POLLING_TIMEOUT
+    assert stored["polling_mode"] == DEFAULT_POLLING_MODE
+    mock_mqtt_class.assert_called_once_with(
+        mock_hass,
+        DEFAULT_TOPIC_PREFIX,
+        broker=None,
+        port=1883,
+        username=None,
+        password=None,
+    )
+
+
 @pytest.mark.asyncio
 async def test_migrate_entry_sets_use_ha_mqtt_and_unique_ids(mock_hass):
     """Migration v2 enables direct MQTT and renames legacy light unique IDs."""
@@ -1,5 +1,6 @@
 """Tests for the Hafele light platform."""
 import asyncio
+from functools import partial
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,10 +10,15 @@ from tests.conftest import schedule_ha_task
 from homeassistant.components.light import ColorMode
 
 from custom_components.hafele_local_mqtt.light import (
+    _brightness_to_lightness,
+    _ceil_lightness,
+    _light_entity_id_for_device,
+    _light_entity_ids_by_addr,
     HafeleLightEntity,
     HafeleLightCoordinator,
+    LightStatusDispatcher,
     PollPriority,
-    run_one_rotational_polling_cycle,
+    RotationalPoller,
 )
 from custom_components.hafele_local_mqtt.const import (
     POLLING_MODE_NORMAL,
@@ -27,6 +33,7 @@ def mock_coordinator():
     """Mock coordinator."""
     coordinator = MagicMock(spec=HafeleLightCoordinator)
     coordinator.data = {"onoff": 1, "lightness": 0.5, "temperature": 3000}
+    coordinator.async_set_optimistic = partial(HafeleLightCoordinator.async_set_optimistic, coordinator)
     coordinator.async_request_refresh = AsyncMock()
     coordinator.polling_mode = POLLING_MODE_NORMAL
     coordinator.hass = MagicMock()
@@ -67,6 +74,14 @@ async def test_light_is_on(mock_coordinator, sample_device_info, mock_mqtt_clien
     mock_coordinator.data = {"onOff": "off"}
     assert entity.is_on is False
 
+    # Numeric and string states on the fallback keys; the first key present wins
+    mock_coordinator.data = {"power": "1"}
+    assert entity.is_on is True
+    mock_coordinator.data = {"state": True}
+    assert entity.is_on is True
+    mock_coordinator.data = {"onoff": 0, "power": "on"}
+    assert entity.is_on is False
+
 
 @pytest.mark.asyncio
 async def test_light_brightness(mock_coordinator, sample_device_info, mock_mqtt_client):
@@ -119,6 +134,31 @@ async def test_light_color_temp(mock_coordinator, sample_multiwhite_device_info,
     assert entity.color_temp_kelvin == 2700
 
 
+def test_light_state_write_parses_coordinator_data_once(
+    mock_coordinator, sample_multiwhite_device_info, mock_mqtt_client
+):
+    """Property reads during one state write are served from a single parse."""
+    from homeassistant.components.light import LightEntity
+
+    entity = HafeleLightEntity(
+        mock_coordinator, 456, sample_multiwhite_device_info, mock_mqtt_client, "hafele"
+    )
+    mock_coordinator.data = {"onoff": 1, "lightness": 0.5, "temperature": 3000}
+    seen = []
+
+    def _write(self):
+        # Data changing mid-write must not leak into the state being written
+        mock_coordinator.data = {"onoff": 0}
+        seen.append((self.is_on, self.brightness, self.color_temp_kelvin))
+
+    with patch.object(LightEntity, "async_write_ha_state", _write):
+        entity.async_write_ha_state()
+
+    assert seen == [(True, 127, 3000)]
+    # Outside a write the properties read live data again
+    assert entity.is_on is False
+
+
 @pytest.mark.asyncio
 async def test_light_turn_on_monochrome(mock_coordinator, sample_device_info, mock_mqtt_client):
     """Test turn_on method for monochrome light."""
@@ -187,6 +227,98 @@ async def test_light_turn_off(mock_coordinator, sample_device_info, mock_mqtt_cl
     assert mock_coordinator.data.get("lightness") == 0.0
 
 
+@pytest.mark.asyncio
+async def test_light_turn_off_then_on_restores_level(
+    mock_coordinator, sample_device_info, sample_multiwhite_device_info, mock_mqtt_client
+):
+    """An off state's lightness 0.0 never replaces the level a bare turn_on restores."""
+    mono = HafeleLightEntity(mock_coordinator, 123, sample_device_info, mock_mqtt_client, "hafele")
+    multi = HafeleLightEntity(
+        mock_coordinator, 456, sample_multiwhite_device_info, mock_mqtt_client, "hafele"
+    )
+
+    for entity in (mono, multi):
+        mock_coordinator.data = {"onoff": 1, "lightness": 0.4, "temperature": 3000}
+        entity.async_write_ha_state()
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            await entity.async_turn_off()
+            # An off status from the gateway is written too
+            entity.async_write_ha_state()
+            mock_mqtt_client.async_publish.reset_mock()
+            await entity.async_turn_on()
+            await _drain_scheduled_tasks()
+
+        payloads = [c.args[1] for c in mock_mqtt_client.async_publish.call_args_list]
+        assert any(isinstance(p, dict) and p["lightness"] == 0.4 for p in payloads)
+        assert mock_coordinator.data["lightness"] == 0.4
+
+
+@pytest.mark.asyncio
+async def test_light_repeated_command_skips_state_write(mock_coordinator, sample_device_info, mock_mqtt_client):
+    """Turning off a light that is already off sends the command but writes no state."""
+    entity = HafeleLightEntity(
+        mock_coordinator, 123, sample_device_info, mock_mqtt_client, "hafele"
+    )
+    entity.async_write_ha_state = MagicMock()
+    entity.async_update_parent_groups = AsyncMock()
+    entity._schedule_manual_update = MagicMock()
+    mock_coordinator.data = {"onoff": 1, "lightness": 0.5}
+
+    await entity.async_turn_off()
+    await entity.async_turn_off()
+
+    assert mock_mqtt_client.async_publish.await_count == 2
+    assert entity._schedule_manual_update.call_count == 2
+    entity.async_write_ha_state.assert_called_once()
+    entity.async_update_parent_groups.assert_awaited_once()
+
+    # Off with a stale non-zero lightness: turn_off zeroes it, HA state stays off
+    mock_coordinator.data = {"onoff": 0, "lightness": 0.3}
+    entity._last_known_lightness = 0.5
+    await entity.async_turn_off()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._last_known_lightness == 0.5
+
+
+@pytest.mark.asyncio
+async def test_light_rapid_commands_keep_one_follow_up(mock_coordinator, sample_device_info, mock_mqtt_client):
+    """A new command replaces the still-pending follow-up refresh."""
+    entity = HafeleLightEntity(
+        mock_coordinator, 123, sample_device_info, mock_mqtt_client, "hafele"
+    )
+    mock_coordinator.data = {}
+
+    await entity.async_turn_on(brightness=64)
+    first = entity._manual_update_task
+    await entity.async_turn_on(brightness=128)
+    await _drain_scheduled_tasks()
+
+    assert first.cancelled()
+    assert not entity._manual_update_task.done()
+    entity._manual_update_task.cancel()
+
+
+def test_light_suggested_object_id_from_device_name(mock_coordinator, mock_mqtt_client):
+    """The entity suggests a sanitized object id instead of pre-registering one."""
+    entity = HafeleLightEntity(
+        mock_coordinator, 7, {"device_name": "Hall-Spot #2"}, mock_mqtt_client, "hafele"
+    )
+    assert entity.suggested_object_id == "hall_spot_2"
+
+
+def test_light_caches_command_topics(mock_coordinator, sample_multiwhite_device_info, mock_mqtt_client):
+    """Command and poll topics are formatted once at construction."""
+    entity = HafeleLightEntity(
+        mock_coordinator, 456, sample_multiwhite_device_info, mock_mqtt_client, "hafele"
+    )
+    assert entity._power_topic == "hafele/lights/Test Multiwhite/power"
+    assert entity._ctl_topic == "hafele/lights/Test Multiwhite/ctl"
+    assert entity._get_lightness_topic == TOPIC_GET_DEVICE_CTL.format(
+        prefix="hafele", device_name="Test Multiwhite"
+    )
+
+
 @pytest.mark.asyncio
 async def test_light_unique_id_uses_device_addr(mock_coordinator, sample_device_info, mock_mqtt_client):
     """Device entities use hafele_{addr} unique_id instead of legacy _mqtt suffix."""
@@ -217,13 +349,20 @@ async def test_light_update_parent_groups(mock_coordinator, sample_device_info,
     )
     unrelated.async_update_group_state_from_children = MagicMock()
 
-    entity.hass.data["light"].entities = [parent, unrelated]
+    for group in (parent, unrelated):
+        group.hass = entity.hass
+        await group.async_added_to_hass()
 
     await entity.async_update_parent_groups()
 
     parent.async_update_group_state_from_children.assert_called_once()
     unrelated.async_update_group_state_from_children.assert_not_called()
 
+    # Removed groups are no longer notified
+    await parent.async_will_remove_from_hass()
+    await entity.async_update_parent_groups()
+    parent.async_update_group_state_from_children.assert_called_once()
+
 
 @pytest.mark.asyncio
 async def test_priority_system(mock_coordinator, sample_device_info, mock_mqtt_client):
@@ -251,15 +390,40 @@ async def test_force_manual_update_normal_mode(mock_coordinator, sample_device_i
         mock_coordinator, 123, sample_device_info, mock_mqtt_client, "hafele"
     )
     mock_coordinator.polling_mode = POLLING_MODE_NORMAL
+    mock_coordinator.status_seen = asyncio.Event()
     
-    with patch("asyncio.sleep", new_callable=AsyncMock):
+    with patch("asyncio.sleep", new_callable=AsyncMock), patch(
+        "custom_components.hafele_local_mqtt.light._MANUAL_UPDATE_WAIT", 0.01
+    ):
         await entity.force_manual_update()
     
-    # Should publish get request after delay
+    # No status arrived, so it should publish a get request
     assert mock_mqtt_client.async_publish.called
     assert entity.priority == PollPriority.HIGH
 
 
+@pytest.mark.asyncio
+async def test_force_manual_update_skips_get_when_status_arrives(
+    mock_coordinator, sample_device_info, mock_mqtt_client
+):
+    """A status pushed after the command makes the follow-up GET unnecessary."""
+    entity = HafeleLightEntity(
+        mock_coordinator, 123, sample_device_info, mock_mqtt_client, "hafele"
+    )
+    mock_coordinator.polling_mode = POLLING_MODE_NORMAL
+    mock_coordinator.status_seen = asyncio.Event()
+
+    real_sleep = asyncio.sleep
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        task = asyncio.ensure_future(entity.force_manual_update())
+        # Let the follow-up reach its wait before the status lands
+        await real_sleep(0)
+        mock_coordinator.status_seen.set()
+        await task
+
+    mock_mqtt_client.async_publish.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_force_manual_update_rotational_mode(mock_coordinator, sample_device_info, mock_mqtt_client):
     """Test force_manual_update in rotational polling mode."""
@@ -273,6 +437,18 @@ async def test_force_manual_update_rotational_mode(mock_coordinator, sample_devi
     
     # Should only set priority, not publish
     assert entity.priority == PollPriority.HIGH
+    # and queue the device with the rotational poller
+    mock_coordinator.poller.mark_high_priority.assert_called_once_with(123)
+
+
+def test_coordinator_data_starts_as_status_dict(mock_hass, mock_mqtt_client):
+    """Optimistic writes can update coordinator.data before any status arrives."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+
+    assert coordinator.data == {}
+    assert coordinator.data is coordinator._status_data
 
 
 @pytest.mark.asyncio
@@ -299,6 +475,87 @@ async def test_coordinator_status_message(mock_hass, mock_mqtt_client):
     assert coordinator._status_data["onoff"] == 1
 
 
+@pytest.mark.asyncio
+async def test_coordinator_status_message_single_field_merges(mock_hass, mock_mqtt_client):
+    """A one-field push updates that field and keeps the rest."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.5, "temperature": 3000})
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"temperature": 4000})
+
+    assert coordinator._status_data == {"lightness": 0.5, "onoff": 1, "temperature": 4000}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_status_message_leaves_published_data_intact(mock_hass, mock_mqtt_client):
+    """A new status builds a new dict; the one already published is not mutated."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.5})
+    published = coordinator.data
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"temperature": 4000})
+
+    assert published == {"lightness": 0.5, "onoff": 1}
+    assert coordinator.data == {"lightness": 0.5, "onoff": 1, "temperature": 4000}
+    assert coordinator.data is coordinator._status_data
+
+
+@pytest.mark.asyncio
+async def test_coordinator_optimistic_update_leaves_published_data_intact(mock_hass, mock_mqtt_client):
+    """Optimistic command state is copy-on-write too, and later statuses build on it."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.5})
+    published = coordinator.data
+
+    coordinator.async_set_optimistic({"onoff": 0, "lightness": 0.0})
+
+    assert published == {"lightness": 0.5, "onoff": 1}
+    assert coordinator.data == {"lightness": 0.0, "onoff": 0}
+    assert coordinator.data is coordinator._status_data
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"temperature": 4000})
+    assert coordinator.data == {"lightness": 0.0, "onoff": 0, "temperature": 4000}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_status_message_unchanged_skips_listeners(mock_hass, mock_mqtt_client):
+    """Repeats and non-state fields don't notify listeners but still end a poll wait."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.5})
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator._status_event.clear()
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.5})
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"rssi": -60})
+
+    coordinator.async_set_updated_data.assert_not_called()
+    assert coordinator._status_event.is_set()
+    assert coordinator._status_data == {"lightness": 0.5, "onoff": 1}
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.6})
+    coordinator.async_set_updated_data.assert_called_once_with({"lightness": 0.6, "onoff": 1})
+
+
+@pytest.mark.asyncio
+async def test_coordinator_status_message_raw_bytes(mock_hass, mock_mqtt_client):
+    """Raw JSON bytes are decoded without a str round trip."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 123, "Test Light", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+
+    coordinator._on_status_message("hafele/lights/Test Light/status", b'{"lightness": 0}')
+
+    assert coordinator._status_data == {"lightness": 0, "onoff": 0}
+
+
 @pytest.mark.asyncio
 async def test_coordinator_update_data(mock_hass, mock_mqtt_client):
     """Test coordinator data update."""
@@ -319,16 +576,52 @@ async def test_coordinator_update_data(mock_hass, mock_mqtt_client):
     entity.is_multiwhite = False
     coordinator.entity = entity
     
-    # Mock status response
-    coordinator._status_received = True
-    coordinator._status_data = {"lightness": 0.5, "onoff": 1}
-    
-    with patch("asyncio.sleep", new_callable=AsyncMock):
-        result = await coordinator._async_update_data()
+    # The gateway answers the GET with a status message
+    mock_mqtt_client.async_publish.side_effect = lambda *args, **kwargs: (
+        coordinator._on_status_message(
+            "hafele/lights/Test Light/status", {"lightness": 0.5}
+        )
+    )
+
+    result = await coordinator._async_update_data()
     
     # Verify publish was called
     mock_mqtt_client.async_publish.assert_called_once()
     assert result["lightness"] == 0.5
+    assert result["onoff"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_poll_after_pushed_status(mock_hass, mock_mqtt_client):
+    """A status pushed within the interval makes the scheduled poll a no-op."""
+    coordinator = HafeleLightCoordinator(
+        mock_hass,
+        mock_mqtt_client,
+        123,
+        "Test Light",
+        "hafele",
+        30,
+        3,
+        POLLING_MODE_NORMAL,
+        [],
+    )
+    coordinator._on_status_message("hafele/lights/Test Light/status", {"lightness": 0.25})
+
+    result = await coordinator._async_update_data()
+
+    mock_mqtt_client.async_publish.assert_not_called()
+    assert result["lightness"] == 0.25
+
+    # Replies to our own poll don't count as pushes
+    mock_mqtt_client.async_publish.side_effect = lambda *args, **kwargs: (
+        coordinator._on_status_message(
+            "hafele/lights/Test Light/status", {"lightness": 0.5}
+        )
+    )
+    coordinator._last_push = None
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    assert mock_mqtt_client.async_publish.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -351,11 +644,10 @@ async def test_coordinator_update_data_timeout(mock_hass, mock_mqtt_client):
     coordinator.entity = entity
     coordinator._status_data = {"lightness": 0.3}  # Old data
     
-    # No response will come
-    coordinator._status_received = False
-    
-    with patch("asyncio.sleep", new_callable=AsyncMock):
-        result = await coordinator._async_update_data()
+    # No response will come; keep the real wait short
+    coordinator.polling_timeout = 0.01
+
+    result = await coordinator._async_update_data()
     
     # Should return old data on timeout
     assert result == {"lightness": 0.3}
@@ -370,7 +662,6 @@ async def test_rotational_polling_high_and_normal_entities_both_polled():
     high_co = MagicMock(spec=HafeleLightCoordinator)
     high_co.async_request_refresh = AsyncMock()
     high_entity = MagicMock()
-    high_entity.priority = PollPriority.HIGH
     high_entity.device_name = "high_light"
     high_entity.coordinator = high_co
     high_entity.reset_priority = MagicMock()
@@ -393,21 +684,258 @@ async def test_rotational_polling_high_and_normal_entities_both_polled():
     normal_co2.entity = normal_entity2
 
     coordinators = {1: high_co, 2: normal_co1, 3: normal_co2}
-    rr_index = 0
-    polling_interval = 1
+    poller = RotationalPoller(coordinators, polling_interval=1)
+    poller.mark_high_priority(1)
 
     with patch("asyncio.sleep", new_callable=AsyncMock):
-        new_rr_index = await run_one_rotational_polling_cycle(
-            coordinators, rr_index, polling_interval
-        )
+        await poller.async_run_cycle()
 
     # HIGH entity was refreshed and reset
     high_co.async_request_refresh.assert_called_once()
     high_entity.reset_priority.assert_called_once()
 
-    # Exactly one NORMAL entity was refreshed (round-robin at index 0 -> first normal)
+    # Exactly one NORMAL entity was refreshed (first in the rotation)
     normal_co1.async_request_refresh.assert_called_once()
     normal_co2.async_request_refresh.assert_not_called()
 
-    # Round-robin index advanced by 1
-    assert new_rr_index == 1
+    # The next cycle moves on to the second NORMAL entity
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        await poller.async_run_cycle()
+    normal_co2.async_request_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rotational_poller_counts_refresh_time_towards_interval():
+    """Time spent waiting for a reply is taken off the sleep that follows."""
+    co = MagicMock(spec=HafeleLightCoordinator)
+    co.async_request_refresh = AsyncMock()
+    co.entity = MagicMock(priority=PollPriority.NORMAL, device_name="desk", coordinator=co)
+    poller = RotationalPoller({1: co}, polling_interval=1)
+    loop = asyncio.get_running_loop()
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep, patch.object(
+        loop, "time", side_effect=[100.0, 100.4]
+    ):
+        await poller.async_run_cycle()
+
+    co.async_request_refresh.assert_awaited_once()
+    assert sleep.await_args.args[0] == pytest.approx(0.6)
+
+
+@pytest.mark.asyncio
+async def test_rotational_poller_picks_up_new_coordinators():
+    """Coordinators added after construction join the rotation."""
+    def _normal(name):
+        co = MagicMock(spec=HafeleLightCoordinator)
+        co.async_request_refresh = AsyncMock()
+        co.entity = MagicMock(priority=PollPriority.NORMAL, device_name=name, coordinator=co)
+        return co
+
+    first = _normal("first")
+    coordinators = {1: first}
+    poller = RotationalPoller(coordinators, polling_interval=1)
+    second = _normal("second")
+    coordinators[2] = second
+
+    with patch("asyncio.sleep", new_callable=AsyncMock):
+        await poller.async_run_cycle()
+        await poller.async_run_cycle()
+        await poller.async_run_cycle()
+
+    assert first.async_request_refresh.await_count == 2
+    assert second.async_request_refresh.await_count == 1
+
+
+def test_light_entity_ids_index_filters_and_falls_back():
+    """The registry index only holds our lights; unknown devices use their name."""
+    entries = [
+        MagicMock(
+            unique_id="hafele_1", entity_id="light.desk", platform="hafele_local_mqtt", domain="light"
+        ),
+        MagicMock(
+            unique_id="1_ping_power", entity_id="button.desk", platform="hafele_local_mqtt", domain="button"
+        ),
+        MagicMock(
+            unique_id="hafele_2", entity_id="light.other", platform="hue", domain="light"
+        ),
+    ]
+
+    index = _light_entity_ids_by_addr(entries)
+
+    assert index == {1: "light.desk"}
+    assert _light_entity_id_for_device(index, 1, {}) == "light.desk"
+    assert _light_entity_id_for_device(index, 2, {"device_name": "Hall Spot"}) == "light.hall_spot"
+
+
+def test_brightness_to_lightness_rounds_up():
+    """Brightness maps to lightness rounded up to 0.01."""
+    assert _brightness_to_lightness(0) == 0.0
+    assert _brightness_to_lightness(1) == 0.01
+    assert _brightness_to_lightness(51) == 0.2
+    assert _brightness_to_lightness(128) == 0.51
+    assert _brightness_to_lightness(255) == 1.0
+
+
+def test_ceil_lightness_keeps_exact_hundredths():
+    """Stored lightness is rounded up to 0.01 without float creep."""
+    assert _ceil_lightness(0.07) == 0.07
+    assert _ceil_lightness(0.29) == 0.29
+    assert _ceil_lightness(0.071) == 0.08
+    assert _ceil_lightness(1.0) == 1.0
+
+
+def test_status_dispatcher_routes_by_device_name(mock_hass, mock_mqtt_client):
+    """One wildcard subscription feeds each coordinator its own status."""
+    dispatcher = LightStatusDispatcher("Mesh/hafele")
+    desk = HafeleLightCoordinator(
+        mock_hass, mock_mqtt_client, 1, "Desk", "Mesh/hafele", 30, 3, POLLING_MODE_NORMAL, []
+    )
+    dispatcher.add(desk)
+
+    assert dispatcher.topic == "Mesh/hafele/lights/+/status"
+    dispatcher.dispatch("Mesh/hafele/lights/Desk/status", {"lightness": 0.4})
+    dispatcher.dispatch("Mesh/hafele/lights/Unknown/status", {"lightness": 1.0})
+
+    assert desk._status_data == {"lightness": 0.4, "onoff": 1}
+
+
+@pytest.mark.asyncio
+async def test_status_dispatcher_through_ha_mqtt_subscription(mock_hass):
+    """HA-mode delivery carries the message topic, not the wildcard pattern."""
+    from custom_components.hafele_local_mqtt.mqtt_client import HafeleMQTTClient
+
+    with patch("custom_components.hafele_local_mqtt.mqtt_client.mqtt") as mock_mqtt:
+        mock_mqtt.async_subscribe = AsyncMock(return_value=MagicMock())
+        client = HafeleMQTTClient(mock_hass, "hafele")
+        dispatcher = LightStatusDispatcher("hafele")
+        desk = HafeleLightCoordinator(
+            mock_hass, client, 1, "Desk", "hafele", 30, 3, POLLING_MODE_NORMAL, []
+        )
+        dispatcher.add(desk)
+        await client.async_subscribe(dispatcher.topic, dispatcher.dispatch)
+
+        message_received = mock_mqtt.async_subscribe.call_args[0][2]
+        message_received(
+            MagicMock(topic="hafele/lights/Desk/status", payload=b'{"lightness": 0.4}')
+        )
+
+    assert desk._status_data == {"lightness": 0.4, "onoff": 1}
+    assert desk.status_seen.is_set()
+
+
+@pytest.mark.asyncio
+async def test_light_setup_registers_only_lights_its_groups_need(
+    mock_hass, mock_config_entry, mock_mqtt_client, mock_discovery, mock_entity_registry
+):
+    """Only new lights a group in the same pass tracks are pre-registered; status subscribes once."""
+    from custom_components.hafele_local_mqtt.const import DOMAIN
+    from custom_components.hafele_local_mqtt.light import async_setup_entry
+
+    devices = {
+        1: {"device_name": "Desk Lamp", "device_types": ["Light"]},
+        2: {"device_name": "Wall Switch", "device_types": ["Switch"]},
+    }
+    mock_discovery.get_all_devices.return_value = devices
+    mock_discovery.get_device.side_effect = devices.get
+    mock_discovery.get_all_groups.return_value = {9: {"group_name": "Kitchen", "devices": [1]}}
+    mock_entity_registry.async_get_or_create.return_value = MagicMock(entity_id="light.desk_lamp")
+    mock_mqtt_client.async_subscribe = AsyncMock(return_value=MagicMock())
+    mock_hass.data[DOMAIN][mock_config_entry.entry_id] = {
+        "mqtt_client": mock_mqtt_client,
+        "discovery": mock_discovery,
+        "topic_prefix": "hafele",
+        "polling_interval": 30,
+        "polling_timeout": 3,
+    }
+    async_add_entities = MagicMock()
+
+    with patch(
+        "custom_components.hafele_local_mqtt.light.er.async_get",
+        return_value=mock_entity_registry,
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    assert entities[0]._attr_unique_id == "hafele_1"
+    assert entities[1].unique_id == "hafele_group_9"
+    assert [e.suggested_object_id for e in entities] == ["desk_lamp", "kitchen"]
+    assert entities[1].tracking_child_ids == ["light.desk_lamp"]
+    mock_entity_registry.async_get_or_create.assert_called_once_with(
+        "light", DOMAIN, "hafele_1", suggested_object_id="desk_lamp"
+    )
+    mock_mqtt_client.async_subscribe.assert_awaited_once()
+    assert mock_mqtt_client.async_subscribe.await_args.args[0] == "hafele/lights/+/status"
+
+
+@pytest.mark.asyncio
+async def test_light_setup_group_tracks_registry_assigned_entity_ids(
+    mock_hass, mock_config_entry, mock_mqtt_client, mock_discovery, mock_entity_registry
+):
+    """Lights whose cleaned names collide are tracked by the entity_id HA assigned."""
+    from custom_components.hafele_local_mqtt.const import DOMAIN
+    from custom_components.hafele_local_mqtt.light import async_setup_entry
+
+    devices = {
+        1: {"device_name": "Desk Lamp", "device_types": ["Light"]},
+        2: {"device_name": "Desk-Lamp", "device_types": ["Light"]},
+    }
+    mock_discovery.get_all_devices.return_value = devices
+    mock_discovery.get_device.side_effect = devices.get
+    mock_discovery.get_all_groups.return_value = {9: {"group_name": "Office", "devices": [1, 2]}}
+    assigned = {"hafele_1": "light.desk_lamp", "hafele_2": "light.desk_lamp_2"}
+    mock_entity_registry.async_get_or_create.side_effect = (
+        lambda domain, platform, unique_id, **kwargs: MagicMock(entity_id=assigned[unique_id])
+    )
+    mock_mqtt_client.async_subscribe = AsyncMock(return_value=MagicMock())
+    mock_hass.data[DOMAIN][mock_config_entry.entry_id] = {
+        "mqtt_client": mock_mqtt_client,
+        "discovery": mock_discovery,
+        "topic_prefix": "hafele",
+        "polling_interval": 30,
+        "polling_timeout": 3,
+    }
+    async_add_entities = MagicMock()
+
+    with patch(
+        "custom_components.hafele_local_mqtt.light.er.async_get",
+        return_value=mock_entity_registry,
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry, async_add_entities)
+
+    group = async_add_entities.call_args[0][0][-1]
+    assert group.tracking_child_ids == ["light.desk_lamp", "light.desk_lamp_2"]
+
+
+@pytest.mark.asyncio
+async def test_light_setup_subscribes_exactly_for_slash_names(
+    mock_hass, mock_config_entry, mock_mqtt_client, mock_discovery, mock_entity_registry
+):
+    """A device name with "/" spans levels "+" can't match; it gets its own topic."""
+    from custom_components.hafele_local_mqtt.const import DOMAIN
+    from custom_components.hafele_local_mqtt.light import async_setup_entry
+
+    devices = {
+        1: {"device_name": "Desk", "device_types": ["Light"]},
+        2: {"device_name": "Hall/Upstairs", "device_types": ["Light"]},
+    }
+    mock_discovery.get_all_devices.return_value = devices
+    mock_mqtt_client.async_subscribe = AsyncMock(return_value=MagicMock())
+    mock_hass.data[DOMAIN][mock_config_entry.entry_id] = {
+        "mqtt_client": mock_mqtt_client,
+        "discovery": mock_discovery,
+        "topic_prefix": "hafele",
+        "polling_interval": 30,
+        "polling_timeout": 3,
+    }
+
+    with patch(
+        "custom_components.hafele_local_mqtt.light.er.async_get",
+        return_value=mock_entity_registry,
+    ):
+        await async_setup_entry(mock_hass, mock_config_entry, MagicMock())
+        await _drain_scheduled_tasks()
+
+    assert [call.args[0] for call in mock_mqtt_client.async_subscribe.await_args_list] == [
+        "hafele/lights/+/status",
+        "hafele/lights/Hall/Upstairs/status",
+    ]
@@ -3,7 +3,11 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
 
-from custom_components.hafele_local_mqtt.mqtt_client import HafeleMQTTClient
+from custom_components.hafele_local_mqtt.mqtt_client import (
+    HafeleMQTTClient,
+    HafeleTopicRouter,
+    async_call_unsubscribers,
+)
 
 
 @pytest.mark.asyncio
@@ -84,6 +88,22 @@ async def test_mqtt_client_publish_bool(mock_hass, mock_mqtt_client):
         assert call_args[0][2] == "true"
 
 
+@pytest.mark.asyncio
+async def test_mqtt_client_publish_empty_payload_as_is(mock_hass):
+    """The shared empty GET payload is published without re-serializing."""
+    from custom_components.hafele_local_mqtt.mqtt_client import EMPTY_PAYLOAD
+
+    with patch("custom_components.hafele_local_mqtt.mqtt_client.mqtt") as mock_mqtt:
+        mock_mqtt.async_publish = AsyncMock()
+
+        client = HafeleMQTTClient(mock_hass, "hafele")
+        with patch("custom_components.hafele_local_mqtt.mqtt_client.json.dumps") as dumps:
+            await client.async_publish("hafele/lights/Desk/getLightness", EMPTY_PAYLOAD)
+
+        dumps.assert_not_called()
+        assert mock_mqtt.async_publish.call_args[0][2] == "{}"
+
+
 @pytest.mark.asyncio
 async def test_mqtt_client_subscribe(mock_hass):
     """Test subscribing to topic."""
@@ -99,3 +119,128 @@ async def test_mqtt_client_subscribe(mock_hass):
         
         assert unsubscribe is not None
         assert "test/topic" in client._subscriptions
+
+
+def test_topic_router_exact_and_wildcards():
+    """Exact, single-level and multi-level patterns all route."""
+    router = HafeleTopicRouter()
+    exact, plus, hash_ = MagicMock(), MagicMock(), MagicMock()
+    router.add("hafele/lights", exact)
+    router.add("hafele/lights/+/status", plus)
+    router.add("hafele/groups/#", hash_)
+
+    assert router.route("hafele/lights") == [exact]
+    assert router.route("hafele/lights/Desk/status") == [plus]
+    assert router.route("hafele/groups/Kitchen/status") == [hash_]
+    assert router.route("hafele/groups") == [hash_]
+    assert router.route("hafele/scenes") == []
+
+
+def test_topic_router_remove_prunes_only_target():
+    """Removing a pattern leaves overlapping patterns intact."""
+    router = HafeleTopicRouter()
+    status, power = MagicMock(), MagicMock()
+    router.add("hafele/lights/Desk/status", status)
+    router.add("hafele/lights/Desk/power", power)
+
+    router.remove("hafele/lights/Desk/status")
+    router.remove("hafele/lights/unknown")
+
+    assert router.route("hafele/lights/Desk/status") == []
+    assert router.route("hafele/lights/Desk/power") == [power]
+
+
+def test_topic_router_reuses_cached_topic_split():
+    """Recurring topics are split once and served from the cache."""
+    from custom_components.hafele_local_mqtt.mqtt_client import _split_topic
+
+    router = HafeleTopicRouter()
+    router.add("hafele/lights/+/status", MagicMock())
+    _split_topic.cache_clear()
+
+    router.route("hafele/lights/Desk/status")
+    router.route("hafele/lights/Desk/status")
+
+    info = _split_topic.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_mqtt_client_ha_receive_runs_inline(mock_hass):
+    """The HA receive wrapper is a plain callback that decodes and dispatches."""
+    import inspect
+
+    with patch("custom_components.hafele_local_mqtt.mqtt_client.mqtt") as mock_mqtt:
+        mock_mqtt.async_subscribe = AsyncMock(return_value=MagicMock())
+
+        client = HafeleMQTTClient(mock_hass, "hafele")
+        callback = MagicMock()
+        await client.async_subscribe("hafele/lights", callback)
+
+        message_received = mock_mqtt.async_subscribe.call_args[0][2]
+        assert not inspect.iscoroutinefunction(message_received)
+
+        message_received(MagicMock(topic="hafele/lights", payload=b'[{"device_addr": 1}]'))
+        callback.assert_called_once_with("hafele/lights", [{"device_addr": 1}])
+
+
+def test_topic_router_wildcards_respect_level_boundaries():
+    """"+" matches exactly one level, "#" matches any remaining levels."""
+    router = HafeleTopicRouter()
+    one, rest = MagicMock(), MagicMock()
+    router.add("hafele/+/status", one)
+    router.add("hafele/lights/#", rest)
+
+    assert router.route("hafele/Desk/status") == [one]
+    assert router.route("hafele/lights/Desk/status") == [rest]
+    assert set(router.route("hafele/lights/status")) == {one, rest}
+    assert router.route("hafele/a/b/status") == []
+
+
+@pytest.mark.asyncio
+async def test_mqtt_client_subscribe_many_direct_single_packet(mock_hass):
+    """Direct connections send one SUBSCRIBE for a batch of topics."""
+    client = HafeleMQTTClient(mock_hass, "hafele", broker="localhost")
+    client._mqtt_client = MagicMock()
+    client._mqtt_client.subscribe = AsyncMock()
+    client._connected = True
+    lights_cb, status_cb = MagicMock(), MagicMock()
+
+    unsubs = await client.async_subscribe_many(
+        [("hafele/lights", lights_cb), ("hafele/lights/Desk/status", status_cb)], qos=1
+    )
+
+    client._mqtt_client.subscribe.assert_awaited_once_with(
+        [("hafele/lights", 1), ("hafele/lights/Desk/status", 1)]
+    )
+    assert len(unsubs) == 2
+    assert client._router.route("hafele/lights/Desk/status") == [status_cb]
+
+
+@pytest.mark.asyncio
+async def test_call_unsubscribers_awaits_async_ones_together():
+    """Async unsubscribers all start before any of them finishes."""
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    def _make(name):
+        async def unsub():
+            started.append(name)
+            await release.wait()
+        return unsub
+
+    sync_unsub = MagicMock()
+    task = asyncio.ensure_future(
+        async_call_unsubscribers([_make("a"), sync_unsub, None, _make("b")])
+    )
+    # One pass to enter the helper, one for the gathered tasks to start
+    for _ in range(2):
+        await asyncio.sleep(0)
+
+    assert started == ["a", "b"]
+    sync_unsub.assert_called_once_with()
+    release.set()
+    await task